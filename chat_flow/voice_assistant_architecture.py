@@ -13,6 +13,7 @@ from dataclasses import dataclass
 from typing import Optional, Dict, Any
 from datetime import datetime
 import logging
+import time
 from enum import Enum
 
 #MARK: Logging
@@ -136,7 +137,7 @@ class ConversationManager:
         self.active = False
         self.immediate_response = None
         self.followup_response = None
-        self.last_interaction = datetime.now()
+        self.last_interaction = time.monotonic()
         
     async def start_conversation(self):
         """Initialize a new conversation"""
@@ -161,7 +162,7 @@ class ConversationManager:
         # Generate both immediate and followup responses
         self.immediate_response = f"Quick response to: {query}"
         self.followup_response = f"Interesting thought about {query}..."
-        self.last_interaction = datetime.now()
+        self.last_interaction = time.monotonic()
         
         return self.immediate_response
     
@@ -169,7 +170,7 @@ class ConversationManager:
         """Check if we should deliver the followup response"""
         await asyncio.sleep(timeout)
         
-        time_since_last = (datetime.now() - self.last_interaction).seconds
+        time_since_last = time.monotonic() - self.last_interaction
         if time_since_last >= timeout and self.followup_response:
             return self.followup_response
         return None
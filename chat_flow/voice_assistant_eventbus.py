@@ -28,6 +28,7 @@ from enum import Enum
 import weakref
 import random
 import json
+import time
 
 # Set up logging with more detail
 #MARK: logging
@@ -565,7 +566,7 @@ class ConversationManager:
         # Response management
         self.immediate_response: Optional[str] = None
         self.followup_response: Optional[str] = None
-        self.last_interaction = datetime.now()
+        self.last_interaction = time.monotonic()  # monotonic: immune to clock changes
         
         # Subscribe to events
         bus.subscribe(PresenceDetectedEvent, self.handle_presence)
@@ -627,14 +628,14 @@ class ConversationManager:
         asyncio.create_task(self.schedule_followup())
         
         # Update interaction time
-        self.last_interaction = datetime.now()
+        self.last_interaction = time.monotonic()
     
     async def schedule_followup(self):
         """Deliver followup response after delay"""
         await asyncio.sleep(5)  # Wait 5 seconds
         
         # Check if still relevant (no new interaction)
-        time_since = (datetime.now() - self.last_interaction).seconds
+        time_since = time.monotonic() - self.last_interaction
         if time_since >= 5 and self.followup_response and self.active:
             self.bus.publish(AssistantSpeechEvent(self.followup_response))
             self.followup_response = None  # Clear after using
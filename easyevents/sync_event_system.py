@@ -39,7 +39,7 @@ import threading
 import time
 import logging
 from typing import Callable, Any, Dict, Optional
-from collections import deque, defaultdict
+from collections import deque
 from functools import wraps
 
 #MARK: original EventBus
@@ -50,7 +50,9 @@ import time
 
 class EventBus:
     def __init__(self):
-        self._topics: dict[str, set[asyncio.Queue]] = {}
+        # Copy-on-write: each topic maps to an immutable tuple that is replaced
+        # (never mutated) on subscribe/unsubscribe, so publish needs no copy or lock
+        self._topics: dict[str, tuple[asyncio.Queue, ...]] = {}
         self._retained: dict[str, deque[tuple[str, object, float]]] = {}
         self._retain_limit: int = 10
 
@@ -58,14 +60,18 @@ class EventBus:
         if retain:
             dq = self._retained.setdefault(topic, deque(maxlen=self._retain_limit))
             dq.append((topic, data, time.time()))
-        queues = self._topics.get(topic, set()).copy()
+        queues = self._topics.get(topic)
+        if not queues:
+            return
+        # One shared item for all subscribers; the queues are unbounded,
+        # so put_nowait never blocks and skips a coroutine per subscriber
+        item = (topic, data)
         for q in queues:
-            await q.put((topic, data))
+            q.put_nowait(item)
 
     async def subscribe(self, topic: str, *, replay_retained: bool = True):
         q: asyncio.Queue = asyncio.Queue()
-        subs = self._topics.setdefault(topic, set())
-        subs.add(q)
+        self._topics[topic] = self._topics.get(topic, ()) + (q,)
         if replay_retained and topic in self._retained:
             for (t, data, _ts) in self._retained[topic]:
                 await q.put((t, data))
@@ -73,8 +79,10 @@ class EventBus:
             while True:
                 yield await q.get()
         finally:
-            subs.discard(q)
-            if not subs:
+            remaining = tuple(x for x in self._topics.get(topic, ()) if x is not q)
+            if remaining:
+                self._topics[topic] = remaining
+            else:
                 self._topics.pop(topic, None)
 
 
@@ -120,7 +128,10 @@ class EasyEvents:
     
     def __init__(self, debug: bool = False):
         self.bus = EventBus()
-        self.handlers: Dict[str, list[Callable]] = defaultdict(list)
+        # Copy-on-write like the bus: tuples are replaced under _sub_lock,
+        # readers just grab the current tuple without locking
+        self.handlers: Dict[str, tuple] = {}
+        self._sub_lock = threading.Lock()
         self.periodic_tasks: list[tuple[Callable, float]] = []
         self.is_running = False
         self.debug = debug
@@ -130,7 +141,7 @@ class EasyEvents:
         if debug:
             logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
     
-    def on(self, topic: str, *, retain: bool = False):
+    def on(self, topic: str, *, retain: bool = False, when: Optional[Callable[[], bool]] = None):
         """
         Decorator to register a synchronous function as an event handler.
         
@@ -142,9 +153,14 @@ class EasyEvents:
             @events.on('status_update', retain=True)  # This handler will see retained messages
             def show_status(status):
                 print(f"Status: {status}")
+
+            @events.on('conversation.start', when=lambda: state.mode != 'sleeping')  # Only called if predicate is true
+            def start():
+                print("Starting")
         """
         def decorator(func: Callable):
-            self.handlers[topic].append((func, retain))
+            with self._sub_lock:
+                self.handlers[topic] = self.handlers.get(topic, ()) + ((func, retain, when),)
             if self.debug:
                 logging.info(f"Registered handler {func.__name__} for topic '{topic}'")
             return func
@@ -174,6 +190,9 @@ class EasyEvents:
             events.publish('user_login', {'username': 'Alice'})
             events.publish('system_status', 'healthy', retain=True)  # This will be retained
         """
+        if not retain and topic not in self.handlers:
+            return  # Nobody listens - don't even schedule anything
+        
         if self._loop and self._loop.is_running():
             # If we're already running, schedule the publish
             future = asyncio.run_coroutine_threadsafe(
@@ -186,10 +205,14 @@ class EasyEvents:
             if self.debug:
                 logging.info(f"Publishing '{topic}' - will start system if needed")
     
-    async def _async_handler_wrapper(self, topic: str, func: Callable, replay_retained: bool):
+    async def _async_handler_wrapper(self, topic: str, func: Callable, replay_retained: bool,
+                                     when: Optional[Callable[[], bool]] = None):
         """Wraps synchronous handlers to work with async subscribe"""
         async for (_topic, data) in self.bus.subscribe(topic, replay_retained=replay_retained):
             try:
+                # Filter at dispatch time, so handlers don't need their own guards
+                if when is not None and not when():
+                    continue
                 if data is None:
                     func()
                 elif isinstance(data, dict):
@@ -218,8 +241,8 @@ class EasyEvents:
             async with asyncio.TaskGroup() as tg:
                 # Start all event handlers
                 for topic, handlers_list in self.handlers.items():
-                    for func, replay_retained in handlers_list:
-                        tg.create_task(self._async_handler_wrapper(topic, func, replay_retained))
+                    for func, replay_retained, when in handlers_list:
+                        tg.create_task(self._async_handler_wrapper(topic, func, replay_retained, when))
                 
                 # Start all periodic tasks  
                 for func, interval in self.periodic_tasks:
@@ -3,9 +3,11 @@
 
 import threading
 import signal
+import queue
 import time
 import random
 import json
+import re
 from sync_event_system import EasyEvents, shared_state
 
 # Your existing imports
@@ -19,6 +21,17 @@ import RPi.GPIO as GPIO
 with open("config.json", "r") as file:
     config = json.load(file)
 
+# Goodbye phrases, lowercased once and compiled into a single regex
+END_WORDS_LC = tuple(w.lower() for w in config["tech_config"]["end_words"])
+END_RE = re.compile("|".join(map(re.escape, END_WORDS_LC))) if END_WORDS_LC else None
+
+# Used when the sensors can't be read (shared, so never mutate it)
+FALLBACK_READINGS: tuple[tuple[str, str, str], ...] = (
+    ("Temperatur (Celsius)", "N/A", "°C"),
+    ("Luftfeuchtigkeit", "N/A", "%"),
+    ("Luftdruck", "N/A", "hPa"),
+)
+
 # Initialize event system
 events = EasyEvents(debug=True)
 
@@ -30,10 +43,23 @@ GPIO.setwarnings(False)
 GPIO.setup(LED_PIN, GPIO.OUT)
 GPIO.setup(BUTTON_PIN, GPIO.IN, pull_up_down=GPIO.PUD_UP)
 
+# LED pulses run as PWM on the pin, so the handlers return immediately
+# pattern -> (frequency in Hz, duty cycle in %, duration in s)
+LED_PULSE_PATTERNS = {
+    'wake': (5, 50, 1.0),      # 5x 100ms on / 100ms off
+    'thinking': (2, 60, 1.5),  # 3x 300ms on / 200ms off
+}
+led_pwm = GPIO.PWM(LED_PIN, 5)
+led_pulse_timer = None
+
 # Initialize shared state
 shared_state.mode = "sleeping"  # "sleeping", "idle", "listening", "thinking", "speaking"
 shared_state.conversation_history = []
 
+# Pending actions for the main thread (which owns the blocking recorder).
+# Handlers put 'record' here when the tree is ready to listen again.
+action_queue = queue.Queue()
+
 #MARK: State Management Events
 @events.on('system.wake')
 def wake_system():
@@ -41,6 +67,7 @@ def wake_system():
     shared_state.mode = "idle"
     logger.info("Tree woke up - ready for interaction")
     events.publish('led.pulse', {'pattern': 'wake'})
+    action_queue.put('record')
 
 @events.on('system.sleep')
 def sleep_system():
@@ -50,13 +77,10 @@ def sleep_system():
     events.publish('audio.goodbye')
     events.publish('led.off')
 
-@events.on('conversation.start')
+@events.on('conversation.start', when=lambda: shared_state.mode != "sleeping")
 def start_conversation():
-    """Begin new conversation"""
-    if shared_state.mode == "sleeping":
-        return  # Ignore if sleeping
-    
-    shared_state.mode = "listening"
+    """Begin new conversation (filtered out by the event system while sleeping)"""
+    # mode is already "listening", set by the main loop before publishing
     shared_state.conversation_history = []
     logger.info("Starting new conversation")
     events.publish('led.on')
@@ -66,33 +90,41 @@ def end_conversation():
     """End current conversation and return to idle"""
     shared_state.mode = "idle"
     logger.info("Conversation ended")
+    action_queue.put('record')
 
 #MARK: LED Control (Event-Driven)
+def stop_led_pulse():
+    """Stop a running pulse pattern (so on/off take effect)"""
+    if led_pulse_timer is not None:
+        led_pulse_timer.cancel()
+    led_pwm.stop()
+
 @events.on('led.on')
 def led_on():
+    stop_led_pulse()
     GPIO.output(LED_PIN, GPIO.HIGH)
 
 @events.on('led.off')
 def led_off():
+    stop_led_pulse()
     GPIO.output(LED_PIN, GPIO.LOW)
 
 @events.on('led.pulse')
 def led_pulse(pattern='default'):
-    """Different LED patterns for different events"""
-    if pattern == 'wake':
-        # Gentle fade-in pattern
-        for i in range(5):
-            GPIO.output(LED_PIN, GPIO.HIGH)
-            time.sleep(0.1)
-            GPIO.output(LED_PIN, GPIO.LOW)
-            time.sleep(0.1)
-    elif pattern == 'thinking':
-        # Slower pulse while processing
-        for i in range(3):
-            GPIO.output(LED_PIN, GPIO.HIGH)
-            time.sleep(0.3)
-            GPIO.output(LED_PIN, GPIO.LOW)
-            time.sleep(0.2)
+    """Different LED patterns for different events (non-blocking, runs as PWM)"""
+    global led_pulse_timer
+    if pattern not in LED_PULSE_PATTERNS:
+        return
+    
+    frequency, duty_cycle, duration = LED_PULSE_PATTERNS[pattern]
+    stop_led_pulse()
+    led_pwm.ChangeFrequency(frequency)
+    led_pwm.start(duty_cycle)
+    
+    # Stop the pattern later without blocking this handler
+    led_pulse_timer = threading.Timer(duration, led_pwm.stop)
+    led_pulse_timer.daemon = True
+    led_pulse_timer.start()
 
 @events.on('audio.goodbye')
 def play_goodbye():
@@ -102,34 +134,7 @@ def play_goodbye():
     goodbye_audio = elevenlabs_tts(random_goodbye["text"])
     play_audio(goodbye_audio)  # Your existing function
 
-#MARK: Button Handler (Clean Event Version)
-def button_handler_events():
-    """
-    Simplified button handler that just publishes events.
-    No more direct global variable manipulation!
-    """
-    last_state = GPIO.HIGH
-    
-    while True:
-        try:
-            current_state = GPIO.input(BUTTON_PIN)
-            
-            # Detect button press (HIGH to LOW)
-            if last_state == GPIO.HIGH and current_state == GPIO.LOW:
-                if shared_state.mode == "sleeping":
-                    events.publish('system.wake')
-                else:
-                    events.publish('system.sleep')
-                
-                time.sleep(0.3)  # Debounce
-            
-            last_state = current_state
-            time.sleep(0.05)
-            
-        except Exception as e:
-            logger.error(f"Button error: {e}")
-            time.sleep(1)
-
+#MARK: Signal Handler
 def signal_handler_events(signum, frame):
     """Signal handler that publishes events instead of changing globals"""
     logger.info("Received SIGUSR1 signal")
@@ -138,33 +143,6 @@ def signal_handler_events(signum, frame):
     else:
         events.publish('system.sleep')
 
-#MARK: Sensor Integration (Event-Driven)
-class EventSensorManager:
-    """
-    Simplified sensor manager that uses events instead of complex threading.
-    Much easier to understand and extend!
-    """
-    def __init__(self):
-        self.current_readings = []
-        
-    @events.on('sensor.reading_request')
-    def update_readings(self):
-        """Update sensor readings when requested"""
-        try:
-            from bme280_sensor import get_sensor_readings
-            self.current_readings = get_sensor_readings()
-            events.publish('sensor.readings_updated', self.current_readings)
-            logger.info(f"Sensor readings updated: {self.current_readings}")
-        except Exception as e:
-            logger.error(f"Sensor reading error: {e}")
-            events.publish('sensor.error', str(e))
-    
-    @events.every(30.0)  # Update sensors every 30 seconds when idle
-    def periodic_update(self):
-        """Periodic background sensor updates"""
-        if shared_state.mode in ["idle", "sleeping"]:
-            events.publish('sensor.reading_request')
-
 #MARK: Simplified Main Loop
 def main_event_driven():
     """
@@ -174,11 +152,8 @@ def main_event_driven():
     setup_logging()
     logger.info("Starting event-driven treebot")
     
-    # Initialize sensor manager (registers its own event handlers)
-    sensor_manager = EventSensorManager()
-    
     # Start button monitoring thread
-    button_thread = threading.Thread(target=button_handler_events, daemon=True)
+    button_thread = threading.Thread(target=button_monitor, daemon=True)
     button_thread.start()
     logger.info("Button monitoring started")
     
@@ -188,6 +163,10 @@ def main_event_driven():
     # Start event system in background
     stop_events = events.run_in_background()
     
+    # Created once and reused - opening the audio device is slow on the Pi
+    voice_recorder = VoiceRecorder()
+    voice_recorder.open()
+    
     # System starts sleeping - button press will wake it
     events.publish('system.sleep')
     logger.info("System initialized - press button to wake")
@@ -195,32 +174,32 @@ def main_event_driven():
     try:
         # Simplified main loop - just handles conversation flow
         while True:
-            if shared_state.mode == "idle":
-                # Ready for conversation - start listening
-                events.publish('conversation.start')
-                
-                # This is the only blocking operation left
-                # (We'll improve this in Phase 2)
-                voice_recorder = VoiceRecorder()
-                audio_stream = voice_recorder.record_audio()
-                
-                if audio_stream:
-                    events.publish('speech.recorded', audio_stream)
-                
-                # Wait a bit before next cycle
-                time.sleep(0.1)
-                
-            elif shared_state.mode == "sleeping":
-                time.sleep(1)  # Just wait when sleeping
-                
-            else:
-                # Other states (thinking, speaking) handled by events
-                time.sleep(0.1)
+            # Block until a handler says we're ready to listen (no polling)
+            action = action_queue.get()
+            if action != 'record' or shared_state.mode != "idle":
+                continue  # Stale request, e.g. went to sleep in the meantime
+            
+            # Ready for conversation - start listening
+            # Mode set here, not in the handler: that runs asynchronously and could flip it back later
+            shared_state.mode = "listening"
+            events.publish('conversation.start')
+            
+            # This is the only blocking operation left
+            # (We'll improve this in Phase 2)
+            audio_stream = voice_recorder.record_audio()
+            
+            if audio_stream:
+                events.publish('speech.recorded', audio_stream)
+            elif shared_state.mode == "listening":  # not if it went to sleep meanwhile
+                # No speech detected - back to idle (else the request is dropped as stale) and listen again
+                shared_state.mode = "idle"
+                action_queue.put('record')
                 
     except KeyboardInterrupt:
         logger.info("Received keyboard interrupt")
     finally:
         logger.info("Shutting down...")
+        voice_recorder.close()
         stop_events()
         GPIO.cleanup()
 
@@ -250,8 +229,7 @@ def process_recorded_speech(audio_stream):
 def handle_transcribed_speech(question, language):
     """Decide what to do with the transcribed speech"""
     # Check for goodbye phrases
-    end_words = config["tech_config"]["end_words"]
-    if any(word.lower() in question.lower() for word in end_words):
+    if END_RE is not None and END_RE.search(question.lower()):
         events.publish('conversation.goodbye')
         return
     
@@ -310,6 +288,7 @@ def audio_playback_finished():
     if shared_state.mode == "speaking":
         shared_state.mode = "idle"  # Ready for next interaction
         logger.info("Ready for next conversation")
+        action_queue.put('record')
 
 #MARK: Event-Driven Sensor Manager 
 @events.on('sensor.reading_request')
@@ -328,11 +307,7 @@ def update_sensor_readings():
     except Exception as e:
         logger.error(f"Sensor error: {e}")
         # Fallback readings
-        shared_state.current_sensor_readings = [
-            ("Temperatur (Celsius)", "N/A", "°C"),
-            ("Luftfeuchtigkeit", "N/A", "%"), 
-            ("Luftdruck", "N/A", "hPa"),
-        ]
+        shared_state.current_sensor_readings = FALLBACK_READINGS
 
 @events.every(60.0)  # Update every minute when idle
 def periodic_sensor_update():
@@ -395,35 +370,42 @@ def main():
     # Start event system
     stop_events = events.run_in_background()
     
+    # Created once and reused - opening the audio device is slow on the Pi
+    voice_recorder = VoiceRecorder()
+    voice_recorder.open()
+    
     # Start in sleep mode
     events.publish('system.sleep')
     logger.info("System ready - press button to start")
     
     try:
-        # Main loop is now much simpler
+        # Main loop is now much simpler - it sleeps until an event handler
+        # queues the next action
         while True:
-            if shared_state.mode == "idle":
-                # Ready for conversation
-                events.publish('conversation.start')
-                
-                # Record audio (still blocking - we'll fix this in Phase 2)
-                voice_recorder = VoiceRecorder() 
-                audio_stream = voice_recorder.record_audio()
-                
-                if audio_stream:
-                    events.publish('speech.recorded', audio_stream)
-                else:
-                    # No speech detected - stay idle
-                    shared_state.mode = "idle"
-                    
-            else:
-                # Let events handle other states
-                time.sleep(0.1)
+            action = action_queue.get()
+            if action != 'record' or shared_state.mode != "idle":
+                continue  # Stale request, e.g. went to sleep in the meantime
+            
+            # Ready for conversation
+            # Mode set here, not in the handler: that runs asynchronously and could flip it back later
+            shared_state.mode = "listening"
+            events.publish('conversation.start')
+            
+            # Record audio (still blocking - we'll fix this in Phase 2)
+            audio_stream = voice_recorder.record_audio()
+            
+            if audio_stream:
+                events.publish('speech.recorded', audio_stream)
+            elif shared_state.mode == "listening":  # not if it went to sleep meanwhile
+                # No speech detected - stay idle and listen again
+                shared_state.mode = "idle"
+                action_queue.put('record')
                 
     except KeyboardInterrupt:
         logger.info("Keyboard interrupt received")
     finally:
         logger.info("Shutting down gracefully")
+        voice_recorder.close()
         stop_events()
         GPIO.cleanup()
 
@@ -27,14 +27,7 @@ class AudioManager:
         self.is_playing = False
         self.is_listening = False
         self.logger = logging.getLogger(self.__class__.__name__)
-        # Store main event loop for thread communication
-        try:
-            self.main_loop = asyncio.get_running_loop()
-        except RuntimeError:
-            self.logger.warning("AudioManager: No running event loop found during init; using get_event_loop().")
-            self.main_loop = asyncio.get_event_loop()
-            
-            
+        
         #MARK: added by copilot
         # why does it use self.bus.subscribe, instead of bus.subscribe, here? 
         # -> it doesn't really matter here, as we're still inside __init__, 
@@ -85,6 +78,30 @@ class AudioManager:
         finally:
             self.is_playing = False
     
+    def _listen_blocking(self) -> Optional[str]:
+        """blocking listen operation (runs in the default executor)"""
+        self.is_listening = True
+        self.logger.info("listening for speech...")
+        try:
+            if config.simulate_hardware:
+                # simulate speech recognition
+                import time
+                import random
+                time.sleep(2)
+                if random.random() > 0.3:
+                    return "Hello, how are you today?"
+                return None
+            else:
+                # real speech recognition would go here
+                # audio = record_audio(timeout)
+                # text = openai.audio.transcribe(audio)
+                return None
+        except Exception as e:
+            self.logger.error(f"error listening: {e}")
+            return None
+        finally:
+            self.is_listening = False
+    
     async def listen_for_speech(self, timeout: Optional[int] = None) -> Optional[str]:
         """
         listen for user speech (async)
@@ -95,49 +112,10 @@ class AudioManager:
         
         timeout = timeout or config.speech_timeout
         
-        # use future to bridge thread/async
-        future = asyncio.Future()
-        
-        def _listen_thread():
-            """blocking listen operation"""
-            self.is_listening = True
-            self.logger.info("listening for speech...")
-            try:
-                if config.simulate_hardware:
-                    # simulate speech recognition
-                    import time
-                    import random
-                    time.sleep(2)
-                    if random.random() > 0.3:
-                        text = "Hello, how are you today?"
-                    else:
-                        text = None
-                else:
-                    # real speech recognition would go here
-                    # audio = record_audio(timeout)
-                    # text = openai.audio.transcribe(audio)
-                    text = None
-                # set result in async context using main event loop
-                asyncio.run_coroutine_threadsafe(
-                    self._set_future(future, text),
-                    self.main_loop
-                )
-            except Exception as e:
-                self.logger.error(f"error listening: {e}")
-                asyncio.run_coroutine_threadsafe(
-                    self._set_future(future, None),
-                    self.main_loop
-                )
-            finally:
-                self.is_listening = False
-        
-        # start listening in thread
-        thread = threading.Thread(target=_listen_thread)
-        thread.start()
-        
-        # wait for result
+        # to_thread hands the result back to the running loop itself,
+        # no stored loop, future or run_coroutine_threadsafe needed
         try:
-            result = await asyncio.wait_for(future, timeout=timeout)
+            result = await asyncio.wait_for(asyncio.to_thread(self._listen_blocking), timeout=timeout)
             if result:
                 self.bus.publish(UserSpeechEvent(result))
             return result
@@ -145,11 +123,6 @@ class AudioManager:
             self.logger.info("listen timeout")
             return None
     
-    async def _set_future(self, future: asyncio.Future, result):
-        """helper to set future result from thread"""
-        if not future.done():
-            future.set_result(result)
-    
     # simple public interface
     async def speak(self, text: str):
         """
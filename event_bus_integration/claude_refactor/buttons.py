@@ -25,6 +25,8 @@ class ButtonMonitor(threading.Thread):
         super().__init__(daemon=True)
         self.bus = bus
         self.running = True
+        # set on stop(), wakes the thread immediately instead of polling
+        self._stop_event = threading.Event()
         self.logger = logging.getLogger(self.__class__.__name__)
         
         # setup gpio if not simulating
@@ -63,20 +65,22 @@ class ButtonMonitor(threading.Thread):
         if config.simulate_hardware:
             # simulation mode - randomly press buttons
             while self.running:
-                threading.Event().wait(10)
+                if self._stop_event.wait(10):
+                    break  # stopped
                 
                 # occasionally simulate a button press
                 if random.random() > 0.95:
                     button = random.choice(list(config.button_pins.keys()))
                     self._button_callback(button)
         else:
-            # real hardware - just keep thread alive
-            while self.running:
-                threading.Event().wait(1)
+            # real hardware - gpio interrupts run the callbacks in their own thread,
+            # so just keep this thread alive until stopped (no wakeups)
+            self._stop_event.wait()
     
     def stop(self):
         """cleanup gpio and stop thread"""
         self.running = False
+        self._stop_event.set()
         
         if not config.simulate_hardware:
             try:
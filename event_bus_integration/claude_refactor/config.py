@@ -20,6 +20,8 @@ class Config:
     # sensor settings
     sensor_interval: int = 60  # seconds between sensor readings
     sensor_csv_file: str = "logs/sensor_data.csv"
+    sensor_csv_flush_rows: int = 16  # rows buffered before writing to csv
+    sensor_csv_flush_interval: int = 300  # seconds, write at least this often
     
     # mmwave sensor settings (human presence detection)
     presence_check_interval: int = 1 # seconds
@@ -48,6 +50,11 @@ class Config:
     # NOT the same thing as the logs from tree_logger -> should probably choose one or the ohter
     debug_log_file: str = "logs/event_log.jsonl" 
     
+    # background log writer (see log_writer.py)
+    log_queue_size: int = 1000  # max queued writes, debug events get dropped beyond this
+    log_flush_interval: float = 0.2  # seconds between flushes
+    log_flush_items: int = 64  # flush early after this many writes
+    
     #MARK: simulation mode 
     # (for testing without hardware)
     # currently a single boolean (just to get it up and running quickly), when adding individual components, adjust this
@@ -9,7 +9,7 @@ handles conversation flow and openai integration
 
 import asyncio
 from typing import Optional
-from datetime import datetime
+import time
 import logging
 
 from config import config
@@ -32,7 +32,11 @@ class ConversationManager:
         # response management
         self.immediate_response: Optional[str] = None
         self.followup_response: Optional[str] = None
-        self.last_interaction = datetime.now()
+        self.last_interaction = time.monotonic()
+        # pending followup, cancelled by the next input or the end of the conversation
+        self._followup_task: Optional[asyncio.Task] = None
+        # loop the followup task runs on (set by _process_user_input)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         
         # subscribe to events
         self.bus.subscribe(ConversationStartEvent, self._handle_start_request)
@@ -46,8 +50,21 @@ class ConversationManager:
             await self.start_conversation()
     
     def _handle_end(self, event: ConversationEndEvent):
-        """conversation ending"""
+        """
+        conversation ending
+        can come from a hardware thread - the followup is then cancelled on its own loop
+        """
         self.active = False
+        loop = self._loop
+        if loop is not None:
+            try:
+                on_loop = asyncio.get_running_loop() is loop
+            except RuntimeError:
+                on_loop = False
+            if on_loop:
+                self._cancel_followup()
+            elif not loop.is_closed():
+                loop.call_soon_threadsafe(self._cancel_followup)
         self.logger.info("conversation ended")
     
     async def start_conversation(self):
@@ -73,6 +90,10 @@ class ConversationManager:
         listens for input and responds
         """
         no_response_count = 0
+        # read settings once, not every turn
+        max_silence_count = config.max_silence_count
+        check_presence_message = config.check_presence_message
+        goodbye_message = config.goodbye_message
         
         while self.active:
             # listen for user
@@ -88,14 +109,16 @@ class ConversationManager:
                 
                 if no_response_count == 1:
                     # first timeout
-                    await self.audio.speak(config.check_presence_message)
-                elif no_response_count >= config.max_silence_count:
+                    await self.audio.speak(check_presence_message)
+                elif no_response_count >= max_silence_count:
                     # too many timeouts - end conversation
-                    await self.audio.speak(config.goodbye_message)
+                    await self.audio.speak(goodbye_message)
                     self.bus.publish(ConversationEndEvent())
                     break
-            
-            await asyncio.sleep(1)
+                
+                # rate-limit silence checks (listen returns right away if still busy);
+                # after real input we go straight back to listening
+                await asyncio.sleep(1)
     
     async def _process_user_input(self, text: str):
         """
@@ -103,6 +126,10 @@ class ConversationManager:
         generate and speak response
         """
         self.logger.info(f"processing: {text}")
+        self._loop = asyncio.get_running_loop()
+        
+        # new input makes the previous followup irrelevant
+        self._cancel_followup()
         
         # generate responses (would use openai here)
         responses = await self._generate_responses(text)
@@ -114,12 +141,13 @@ class ConversationManager:
             # speak immediate response
             if self.immediate_response:
                 await self.audio.speak(self.immediate_response)
-            
-            # schedule followup
-            if self.followup_response:
-                asyncio.create_task(self._deliver_followup())
         
-        self.last_interaction = datetime.now()
+        # before scheduling the followup: eager tasks run up to their first await right away
+        self.last_interaction = time.monotonic()
+        
+        # schedule followup (kept, so the next input or the end of the conversation can cancel it)
+        if responses and self.followup_response:
+            self._followup_task = asyncio.create_task(self._deliver_followup())
     
     async def _generate_responses(self, user_input: str) -> Optional[dict]:
         """
@@ -142,8 +170,13 @@ class ConversationManager:
         """deliver followup response after delay"""
         await asyncio.sleep(config.followup_delay)
         
-        # check if still relevant
-        time_since = (datetime.now() - self.last_interaction).seconds
-        if time_since >= config.followup_delay and self.followup_response and self.active:
+        # no timestamp check needed: newer input or the end of the conversation cancels this task
+        if self.followup_response and self.active:
             await self.audio.speak(self.followup_response)
             self.followup_response = None  # clear after using
+    
+    def _cancel_followup(self):
+        """cancel the pending followup, if any"""
+        if self._followup_task is not None and not self._followup_task.done():
+            self._followup_task.cancel()
+        self._followup_task = None
@@ -9,11 +9,39 @@ logs all events and provides visibility into system
 
 import json
 import logging
-from typing import List
+import dataclasses
+from collections import deque
+from datetime import datetime
+from enum import Enum
+from typing import Any, List
+
+try:
+    # optional: 3-10x faster than json and returns bytes directly
+    import orjson
+except ImportError:
+    orjson = None
 
 from config import config
 from events import *
 from event_bus import EventBus
+from log_writer import LogWriter
+
+
+def _default(obj: Any) -> Any:
+    """fallback for values json can't serialize (orjson handles most natively)"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj):
+        return dataclasses.asdict(obj)
+    return repr(obj)
+
+def _dumps_line(entry: dict) -> bytes:
+    """serialize one json lines entry (including the newline) to bytes"""
+    if orjson is not None:
+        return orjson.dumps(entry, default=_default, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(entry, default=_default) + '\n').encode('utf-8')
 
 #MARK: DebugMonitor
 class DebugMonitor:
@@ -21,37 +49,35 @@ class DebugMonitor:
     monitors all events for debugging
     can output to file, console, leds, web, etc
     """
-    def __init__(self, bus: EventBus):
+    def __init__(self, bus: EventBus, log_writer: LogWriter):
         self.bus = bus
+        # file writes happen in the log writer thread, not on the publish path
+        self.log_writer = log_writer
+        self._log_file = config.debug_log_file
         self.logger = logging.getLogger(self.__class__.__name__)
         
-        # list of all event types to monitor (currently simply includes everything)
-        self.event_types = [
-            SensorDataEvent, PresenceDetectedEvent, PresenceLostEvent,
-            ButtonPressEvent, ConversationStartEvent, ConversationEndEvent,
-            UserSpeechEvent, AssistantSpeechEvent, SystemStateChangeEvent,
-            ShutdownRequestEvent, InterruptAudioEvent
-        ]
+        # most recent entries kept in memory, the log file is just an archive
+        self.recent_events = deque(maxlen=config.event_history_size)
         
-        # subscribe to all events
-        for event_type in self.event_types:
-            bus.subscribe(event_type, self._log_event)
+        # subscribe to all events (new event types are picked up automatically)
+        bus.subscribe_all(self._log_event)
         
         self.logger.info("debug monitor started")
     
     def _log_event(self, event: Event):
         """log event to file in json format"""
         try:
-            # create log entry
+            # create log entry (data is serialized by the encoder, no str() copies)
             entry = {
-                'timestamp': event.timestamp.isoformat(),
+                'timestamp_ns': event.epoch_ns,  # unix epoch ns
                 'type': event.event_type,
-                'data': str(event.data)
+                'data': event.data
             }
             
-            # append to json lines file
-            with open(config.debug_log_file, 'a') as f:
-                f.write(json.dumps(entry) + '\n')
+            self.recent_events.append(entry)
+            
+            # hand over to the log writer (drops new debug entries if it falls behind)
+            self.log_writer.write(self._log_file, _dumps_line(entry), block=False)
             
             # could also:
             # - update led indicators
@@ -63,16 +89,7 @@ class DebugMonitor:
     
     def get_recent_events(self, count: int = 10) -> List[dict]:
         """
-        get recent events from log
+        get recent events (from memory, not the log file)
         useful for debugging and monitoring
         """
-        events = []
-        try:
-            with open(config.debug_log_file, 'r') as f:
-                lines = f.readlines()
-                for line in lines[-count:]:
-                    events.append(json.loads(line))
-        except Exception as e:
-            self.logger.error(f"failed to read events: {e}")
-        
-        return events
+        return list(self.recent_events)[-count:]
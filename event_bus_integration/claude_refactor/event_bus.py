@@ -1,21 +1,24 @@
 import asyncio
-import threading
-import queue
-from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List, Callable, Union
-from datetime import datetime
+import inspect
+from typing import Optional, Dict, List, Callable, Iterable, Tuple
 import logging
-from enum import Enum
 import weakref
-import random
-import json
+from collections import deque
 from events import *
 
-import logging
-
 # use module specific logger (needs to be set up in config)
 logger = logging.getLogger(__name__)
 
+
+def _make_weakref(callback: Callable) -> weakref.ref:
+    """
+    WeakMethod for bound methods (inside classes like system_controller), weakref.ref for functions
+    (a plain weakref to a bound method would die immediately)
+    """
+    if inspect.ismethod(callback):
+        return weakref.WeakMethod(callback)
+    return weakref.ref(callback)
+
 #MARK:
 class EventBus:
     """
@@ -30,18 +33,25 @@ class EventBus:
         # Using weakref.WeakMethod to automatically clean up when objects are deleted
         self._subscribers: Dict[type, List[weakref.ref]] = {}
         
-        # For thread-safe operation between async and sync code
-        self._event_queue = queue.Queue()
-        
         # For async subscribers
         self._async_subscribers: Dict[type, List[Callable]] = {}
         
-        # Event history for debugging
-        self.event_history: List[Event] = []
+        # Sync callbacks that receive every event, regardless of type (e.g. DebugMonitor)
+        self._wildcard_subscribers: List[weakref.ref] = []
+        
+        # Loop that runs async subscribers (needed when publishing from other threads)
+        try:
+            self._loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
+        # Keep references to running callback tasks so they aren't garbage collected
+        self._tasks: set = set()
+        
+        # Event history for debugging (bounded, oldest events drop out in O(1))
         self.max_history = 100
+        self.event_history: deque = deque(maxlen=self.max_history)
     
     def subscribe(self, event_type: type, callback: Callable):
-        logger.debug(f"Subscribing {callback} to {event_type}")
         """
         Subscribe to events of a specific type.
         
@@ -49,104 +59,183 @@ class EventBus:
             event_type: The Event class to subscribe to
             callback: Function to call when event occurs
         """
+        debug = logger.isEnabledFor(logging.DEBUG)  # skip building debug strings otherwise
+        if debug:
+            logger.debug("Subscribing %s to %s", callback, event_type)
+        
         # Determine if callback is async or sync
         if asyncio.iscoroutinefunction(callback):
             # Async callback
+            if self._loop is None:
+                try:
+                    self._loop = asyncio.get_running_loop()
+                except RuntimeError:
+                    pass
             if event_type not in self._async_subscribers:
                 self._async_subscribers[event_type] = []
             self._async_subscribers[event_type].append(callback)
-            logger.debug(f"Async subscription: {callback.__name__} -> {event_type.__name__}")
+            if debug:
+                logger.debug("Async subscription: %s -> %s", callback.__name__, event_type.__name__)
         else:
             # Sync callback - use weakref to avoid memory leaks
             if event_type not in self._subscribers:
                 self._subscribers[event_type] = []
                 
-            # Use WeakMethod for bound methods (inside classes like system_controller), weakref.ref for functions
-            if hasattr(callback, "__self__") and callback.__self__ is not None:
-                # Bound method
-                weak_callback = weakref.WeakMethod(callback)
-            else:
-                # Function
-                weak_callback = weakref.ref(callback)
-            self._subscribers[event_type].append(weak_callback)
-            logger.debug(f"Sync subscription: {callback.__name__} -> {event_type.__name__}")
+            self._subscribers[event_type].append(_make_weakref(callback))
+            if debug:
+                logger.debug("Sync subscription: %s -> %s", callback.__name__, event_type.__name__)
+    
+    def subscribe_all(self, callback: Callable):
+        """
+        Subscribe a sync callback to every event type (including ones added later).
+        
+        Args:
+            callback: Function to call for each published event
+        """
+        self._wildcard_subscribers.append(_make_weakref(callback))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Wildcard subscription: %s", callback.__name__)
     
     def publish(self, event: Event):
-        logger.debug(f"Publishing event: {event} to subscribers of type {type(event)}")
         """
         Publish an event to all subscribers.
         Can be called from both sync and async contexts.
+        Sync subscribers are called right away, async ones are scheduled on the loop.
+        """
+        event_type = event.__class__
+        self._notify_sync(event, event_type)
+        
+        # most event types have no async subscribers - skip scheduling entirely
+        callbacks = self._async_subscribers.get(event_type)
+        if callbacks:
+            self._schedule_async([(callbacks, event)])
+    
+    def publish_many(self, events: Iterable[Event]):
         """
+        Publish several events in order.
+        Same as calling publish() for each, but the async subscribers of all
+        events are handed to the loop in one go (one wakeup instead of one per event).
+        """
+        pending = []
+        for event in events:
+            event_type = event.__class__
+            self._notify_sync(event, event_type)
+            callbacks = self._async_subscribers.get(event_type)
+            if callbacks:
+                pending.append((callbacks, event))
+        if pending:
+            self._schedule_async(pending)
+    
+    def _notify_sync(self, event: Event, event_type: type):
+        """record event in history and call sync subscribers"""
+        # only build the debug strings if they'll actually be logged
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Publishing event: %s to subscribers of type %s", event, event_type)
+        
         # Store in history for debugging
         self.event_history.append(event)
-        if len(self.event_history) > self.max_history:
-            self.event_history.pop(0)
         
-        logger.info(f"Event published: {event}")
+        logger.info("Event published: %r", event)
         
         # Handle sync subscribers
-        event_type = type(event)
-        if event_type in self._subscribers:
-            logger.debug(f"Found {len(self._subscribers[event_type])} sync subscribers for {event_type}")
-            # Clean up dead references and call alive ones
-            alive_callbacks = []
-            for weak_callback in self._subscribers[event_type]:
+        weak_callbacks = self._subscribers.get(event_type)
+        if weak_callbacks:
+            if debug:
+                logger.debug("Found %d sync subscribers for %s", len(weak_callbacks), event_type)
+            # Call alive callbacks, the list is only rebuilt if a reference died
+            found_dead = False
+            for weak_callback in weak_callbacks:
                 callback = weak_callback()
-                logger.debug(f"Checking callback: {callback}")
-                if callback is not None:
-                    alive_callbacks.append(weak_callback)
-                    try:
-                        logger.debug(f"Calling sync callback: {callback} for event: {event}")
-                        callback(event)
-                    except Exception as e:
-                        logger.error(f"Error in sync callback: {e}")
-            # Update list with only alive callbacks
-            self._subscribers[event_type] = alive_callbacks
+                if callback is None:
+                    found_dead = True
+                    continue
+                try:
+                    if debug:
+                        logger.debug("Calling sync callback: %s for event: %s", callback, event)
+                    callback(event)
+                except Exception as e:
+                    logger.error("Error in sync callback: %s", e)
+            if found_dead:
+                self._prune_dead(event_type)
         
-        # Queue event for async processing
-        self._event_queue.put(event)
+        # Handle wildcard subscribers (one list for all event types)
+        if self._wildcard_subscribers:
+            found_dead = False
+            for weak_callback in self._wildcard_subscribers:
+                callback = weak_callback()
+                if callback is None:
+                    found_dead = True
+                    continue
+                try:
+                    callback(event)
+                except Exception as e:
+                    logger.error("Error in wildcard callback: %s", e)
+            if found_dead:
+                self._wildcard_subscribers = [
+                    weak_callback for weak_callback in self._wildcard_subscribers
+                    if weak_callback() is not None
+                ]
+    
+    def _schedule_async(self, pending: List[Tuple[List[Callable], Event]]):
+        """start a task per async subscriber of each (callbacks, event) pair, from any thread"""
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        
+        if running_loop is not None:
+            # already on the loop - start tasks directly
+            self._loop = running_loop
+            self._start_tasks(pending)
+        elif self._loop is not None and not self._loop.is_closed():
+            # called from another thread (sensors, buttons, audio) - hand over to the loop
+            try:
+                self._loop.call_soon_threadsafe(self._start_tasks, pending)
+            except RuntimeError:
+                logger.warning("Event loop closed, async subscribers skipped for: %s", [event for _, event in pending])
+        else:
+            logger.warning("No event loop, async subscribers skipped for: %s", [event for _, event in pending])
+    
+    def _start_tasks(self, pending: List[Tuple[List[Callable], Event]]):
+        """create tasks for async callbacks (must run on the loop)"""
+        for callbacks, event in pending:
+            for callback in callbacks:
+                task = asyncio.create_task(self._run_async_callback(callback, event))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+    
+    async def _run_async_callback(self, callback: Callable, event: Event):
+        try:
+            await callback(event)
+        except Exception as e:
+            logger.error("Error in async callback: %s", e)
+    
+    def _prune_dead(self, event_type: type):
+        """drop subscriptions whose objects have been garbage collected"""
+        self._subscribers[event_type] = [
+            weak_callback for weak_callback in self._subscribers[event_type]
+            if weak_callback() is not None
+        ]
     
     async def async_publish(self, event: Event):
         """
-        Async version of publish - ensures async subscribers are called properly.
+        Async version of publish - waits until async subscribers are done.
         """
-        self.publish(event)  # Handle sync subscribers first
+        event_type = event.__class__
+        self._notify_sync(event, event_type)  # Handle sync subscribers first
         
         # Handle async subscribers
-        event_type = type(event)
-        if event_type in self._async_subscribers:
-            # Create tasks for all async callbacks
-            tasks = []
-            for callback in self._async_subscribers[event_type]:
-                tasks.append(asyncio.create_task(callback(event)))
-            
-            # Wait for all callbacks to complete
-            if tasks:
-                await asyncio.gather(*tasks, return_exceptions=True)
-    
-    async def process_events(self):
-        """
-        Process queued events in async context.
-        This bridges the sync/async worlds.
-        """
-        while True:
-            try:
-                # Non-blocking check for events
-                if not self._event_queue.empty():
-                    event = self._event_queue.get_nowait()
-                    
-                    # Process async subscribers
-                    event_type = type(event)
-                    if event_type in self._async_subscribers:
-                        for callback in self._async_subscribers[event_type]:
-                            try:
-                                await callback(event)
-                            except Exception as e:
-                                logger.error(f"Error in async callback: {e}")
-                
-                await asyncio.sleep(0.01)  # Small delay to prevent CPU spinning
-            except queue.Empty:
-                await asyncio.sleep(0.01)
-            except Exception as e:
-                logger.error(f"Error processing events: {e}")
-                
+        callbacks = self._async_subscribers.get(event_type)
+        if not callbacks:
+            return
+        if len(callbacks) == 1:
+            # single subscriber - await it directly, no Task needed
+            await self._run_async_callback(callbacks[0], event)
+            return
+        
+        # several subscribers - run them concurrently and wait for all
+        await asyncio.gather(
+            *(self._run_async_callback(callback, event) for callback in callbacks),
+            return_exceptions=True
+        )
@@ -10,16 +10,41 @@ this should only include events that are either directly consumed by other compo
 
 """
 
+import time
 from datetime import datetime
 from typing import Any
 
+# offset to turn monotonic ns into unix epoch ns (taken once at import)
+_EPOCH_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
 #MARK: Event
 class Event:
     """base event class - all events inherit from this"""
+    # no per-instance __dict__ -> smaller, faster events (subclasses declare empty __slots__)
+    __slots__ = ('timestamp_ns', '_timestamp', 'data')
+    event_type = "Event"  # class name, set once per class by __init_subclass__ instead of per instance
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.event_type = cls.__name__
+    
     def __init__(self, data: Any = None):
-        self.timestamp = datetime.now()
+        # plain int, much cheaper than datetime.now() on every publish
+        self.timestamp_ns = time.monotonic_ns()
+        self._timestamp = None  # datetime, only created when needed
         self.data = data
-        self.event_type = self.__class__.__name__
+    
+    @property
+    def epoch_ns(self) -> int:
+        """wall clock time of the event in ns since the unix epoch"""
+        return self.timestamp_ns + _EPOCH_OFFSET_NS
+    
+    @property
+    def timestamp(self) -> datetime:
+        """wall clock time of the event as (local) datetime"""
+        if self._timestamp is None:
+            self._timestamp = datetime.fromtimestamp(self.epoch_ns / 1e9)
+        return self._timestamp
     
     def __repr__(self):
         return f"{self.event_type}(data={self.data}, time={self.timestamp})"
@@ -27,47 +52,47 @@ class Event:
 #MARK: hardware events
 class SensorDataEvent(Event):
     """new sensor reading available"""
-    pass
+    __slots__ = ()
 
 class PresenceDetectedEvent(Event):
     """person entered detection range"""
-    pass
+    __slots__ = ()
 
 class PresenceLostEvent(Event):
     """person left detection range"""
-    pass
+    __slots__ = ()
 
 class ButtonPressEvent(Event):
     """gpio button was pressed"""
-    pass
+    __slots__ = ()
 
 #MARK: conversation events
 class ConversationStartEvent(Event):
     """start a new conversation"""
-    pass
+    __slots__ = ()
 
 class ConversationEndEvent(Event):
     """conversation has ended"""
-    pass
+    __slots__ = ()
 
 class UserSpeechEvent(Event):
     """user said something"""
-    pass
+    __slots__ = ()
 
 class AssistantSpeechEvent(Event):
     """assistant wants to speak"""
-    pass
+    __slots__ = ()
 
 #MARK: system events
 class SystemStateChangeEvent(Event):
     """system state changed"""
-    pass
+    __slots__ = ()
 
 class ShutdownRequestEvent(Event):
     """shutdown the system"""
-    pass
+    __slots__ = ()
 
 #MARK: audio interrupt event
 class InterruptAudioEvent(Event):
     """Signal to interrupt/cancel audio operations (listening/playback)"""
-    pass
+    __slots__ = ()
@@ -0,0 +1,114 @@
+# ==========================
+# log_writer.py
+# ==========================
+"""
+log_writer.py - background file writer
+keeps blocking file i/o off the event publishing path
+"""
+
+import queue
+import threading
+import time
+import logging
+from typing import Dict, BinaryIO
+
+from config import config
+
+# put on the queue by stop() to tell the writer to finish
+_STOP = object()
+
+#MARK: LogWriter
+class LogWriter(threading.Thread):
+    """
+    single thread that owns all log file handles
+    producers hand over (path, bytes) through a bounded queue,
+    the writer drains it in batches and flushes every few items or ms
+    """
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._queue = queue.Queue(maxsize=config.log_queue_size)
+        self._files: Dict[str, BinaryIO] = {}
+        self.dropped = 0  # debug entries dropped because the queue was full
+
+    def write(self, path: str, data: bytes, block: bool = True):
+        """
+        queue data to be appended to path
+        block=True waits for space (sensor data),
+        block=False drops data itself when full (debug events) - never anything already
+        queued, that could be sensor data or the stop marker
+        """
+        if block:
+            self._queue.put((path, data))
+            return
+
+        try:
+            self._queue.put_nowait((path, data))
+        except queue.Full:
+            self.dropped += 1
+
+    def run(self):
+        """main thread loop - drain, write, flush"""
+        flush_interval = config.log_flush_interval
+        flush_items = config.log_flush_items
+        pending = 0
+        last_flush = time.monotonic()
+        stopping = False
+
+        while not stopping:
+            batch = []
+            try:
+                batch.append(self._queue.get(timeout=flush_interval))
+                # grab everything else that's waiting
+                while len(batch) < flush_items:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            for item in batch:
+                if item is _STOP:
+                    stopping = True
+                    continue
+                path, data = item
+                try:
+                    self._get_file(path).write(data)
+                    pending += 1
+                except Exception as e:
+                    self.logger.error(f"failed to write to {path}: {e}")
+
+            if pending and (stopping or pending >= flush_items
+                            or time.monotonic() - last_flush >= flush_interval):
+                self._flush()
+                pending = 0
+                last_flush = time.monotonic()
+
+        self._close_files()
+
+    def _get_file(self, path: str) -> BinaryIO:
+        """open each file once and keep the handle"""
+        fh = self._files.get(path)
+        if fh is None:
+            fh = self._files[path] = open(path, 'ab', buffering=1 << 16)
+        return fh
+
+    def _flush(self):
+        for path, fh in self._files.items():
+            try:
+                fh.flush()
+            except Exception as e:
+                self.logger.error(f"failed to flush {path}: {e}")
+
+    def _close_files(self):
+        for fh in self._files.values():
+            try:
+                fh.close()
+            except Exception:
+                pass
+        self._files.clear()
+
+    def stop(self, timeout: float = 2.0):
+        """write everything still queued, then close the files"""
+        if not self.is_alive():
+            return
+        self._queue.put(_STOP)
+        self.join(timeout)
@@ -1,3 +1,11 @@
+"""
+mmwave_sensor.py - simulated mmWave presence sensor
+
+Dwell-time simulation: presence only changes every 5-15 s (instead of a
+coin flip every tick), which keeps presence events on the bus rare.
+event_bus_integration/mmwave_sensor.py uses the same logic.
+"""
+
 import threading
 import random
 import logging
@@ -15,6 +23,8 @@ class MMWaveSensor(threading.Thread):
         super().__init__(daemon=True)
         self.bus = bus
         self.running = True
+        # set on stop(), wakes the thread immediately instead of waiting out the interval
+        self._stop_event = threading.Event()
         self.presence = False
         self.logger = logging.getLogger(self.__class__.__name__)
     
@@ -25,15 +35,13 @@ class MMWaveSensor(threading.Thread):
         #MARK: simulated
         # just simulates actual sensor readings via random generator
         total_time = 0
+        interval = config.presence_check_interval  # local, not re-read every tick
         while self.running:
             try:
                 if total_time <= 0:
                     # Randomly decide next state and dwell duration
                     new_presence = random.random() > 0.5  # 50% chance to switch
-                    if new_presence:
-                        total_time = random.randint(5, 15)  # seconds present
-                    else:
-                        total_time = random.randint(5, 15)  # seconds absent
+                    total_time = random.randint(5, 15)  # seconds present/absent
                     # Only publish on state change
                     if new_presence != self.presence:
                         self.presence = new_presence
@@ -42,7 +50,15 @@ class MMWaveSensor(threading.Thread):
                         else:
                             self.bus.publish(PresenceLostEvent())
                 else:
-                    total_time -= config.presence_check_interval
-                threading.Event().wait(config.presence_check_interval)
+                    total_time -= interval
             except Exception as e:
                 self.logger.error(f"Error reading mmWave sensor: {e}")
+            
+            if self._stop_event.wait(interval):
+                break  # stopped
+    
+    def stop(self):
+        """stop the sensor thread"""
+        self.running = False
+        self._stop_event.set()
+        self.logger.info("MMWave sensor stopped")
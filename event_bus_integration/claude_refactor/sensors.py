@@ -9,7 +9,8 @@ hides complexity of gpio/hardware interaction
 
 import threading
 import random
-import csv
+import time
+from collections import deque
 from datetime import datetime
 import logging
 from typing import Optional
@@ -17,22 +18,69 @@ from typing import Optional
 from config import config
 from events import SensorDataEvent
 from event_bus import EventBus
+from log_writer import LogWriter
 from state import SensorData
 
+#MARK: SensorCsvSink
+class SensorCsvSink:
+    """
+    buffers csv rows in memory and appends them in batches
+    one file write per batch instead of per reading (less sd card wear)
+    the actual write happens in the log writer thread
+    """
+    def __init__(self, path: str, log_writer: LogWriter, max_rows: int, max_age: float):
+        self.path = path
+        self.log_writer = log_writer
+        self.max_rows = max_rows
+        self.max_age = max_age
+        self._buffer = deque()
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def write_line(self, line: str):
+        """queue a csv line, writing the batch once it's full or old enough"""
+        with self._lock:
+            self._buffer.append(line)
+            if (len(self._buffer) >= self.max_rows
+                    or time.monotonic() - self._last_flush > self.max_age):
+                self._flush_locked()
+    
+    def flush(self):
+        """write all buffered rows now"""
+        with self._lock:
+            self._flush_locked()
+    
+    def _flush_locked(self):
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        data = ''.join(self._buffer).encode('utf-8')
+        self._buffer.clear()
+        # sensor data must not be dropped, so wait for queue space
+        self.log_writer.write(self.path, data, block=True)
+
 #MARK: SensorReader
 class SensorReader(threading.Thread):
     """
     reads environmental sensors periodically
     runs in separate thread to avoid blocking
     """
-    def __init__(self, bus: EventBus):
+    def __init__(self, bus: EventBus, log_writer: LogWriter):
         super().__init__(daemon=True)
         self.bus = bus
         self.running = True
+        # set on stop(), wakes the thread immediately instead of waiting out the interval
+        self._stop_event = threading.Event()
         self.logger = logging.getLogger(self.__class__.__name__)
         
         # prepare csv file
         self._init_csv()
+        self.csv_sink = SensorCsvSink(
+            config.sensor_csv_file,
+            log_writer,
+            max_rows=config.sensor_csv_flush_rows,
+            max_age=config.sensor_csv_flush_interval
+        )
     
     def _init_csv(self):
         """create csv file with headers if needed"""
@@ -43,13 +91,13 @@ class SensorReader(threading.Thread):
         except FileNotFoundError:
             # create file with headers
             with open(config.sensor_csv_file, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(['timestamp', 'temperature', 'humidity', 'presence'])
+                f.write("timestamp,temperature,humidity,presence\r\n")  # \r\n like csv.writer
             self.logger.info(f"created sensor csv: {config.sensor_csv_file}")
     
     def run(self):
         """main thread loop"""
-        self.logger.info(f"sensor reader started, interval={config.sensor_interval}s")
+        interval = config.sensor_interval  # local, not re-read every tick
+        self.logger.info(f"sensor reader started, interval={interval}s")
         
         while self.running:
             try:
@@ -66,7 +114,8 @@ class SensorReader(threading.Thread):
                 self.logger.error(f"error reading sensors: {e}")
             
             # wait for next reading
-            threading.Event().wait(config.sensor_interval)
+            if self._stop_event.wait(interval):
+                break  # stopped
     
     def _read_sensors(self) -> SensorData:
         """
@@ -89,22 +138,25 @@ class SensorReader(threading.Thread):
             pass
     
     def _save_to_csv(self, data: SensorData):
-        """save reading to csv file"""
+        """save reading to csv file (buffered, see SensorCsvSink)"""
         try:
-            with open(config.sensor_csv_file, 'a', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    data.timestamp.isoformat(),
-                    round(data.temperature, 2),
-                    round(data.humidity, 2),
-                    data.presence_detected
-                ])
+            # plain numbers/bools/iso strings never need csv quoting, so skip csv.writer
+            # (same output as csv.writer: rounded floats as str(), \r\n line ends)
+            self.csv_sink.write_line(
+                f"{data.timestamp.isoformat()},{round(data.temperature, 2)},"
+                f"{round(data.humidity, 2)},{data.presence_detected}\r\n"
+            )
         except Exception as e:
             self.logger.error(f"failed to save to csv: {e}")
     
     def stop(self):
         """stop the sensor thread gracefully"""
         self.running = False
+        self._stop_event.set()
+        try:
+            self.csv_sink.flush()  # don't lose buffered rows
+        except Exception as e:
+            self.logger.error(f"failed to flush csv: {e}")
         self.logger.info("sensor reader stopping")
 
     # simple public interface
@@ -7,6 +7,7 @@ system_controller.py - main system coordinator
 ties everything together
 """
 
+import os
 import asyncio
 import subprocess
 import logging
@@ -14,6 +15,7 @@ import logging
 from config import config
 from events import *
 from event_bus import EventBus
+from log_writer import LogWriter
 from state import StateManager, SystemState
 from sensors import SensorReader
 from buttons import ButtonMonitor
@@ -21,6 +23,22 @@ from mmwave_sensor import MMWaveSensor
 from audio_manager import AudioManager
 from conversation import ConversationManager
 
+#MARK: power off
+def power_off():
+    """
+    shutdown raspberry pi - replaces this process instead of forking a multi-threaded one
+    call it once the event loop has finished and the controller is cleaned up
+    """
+    logger = logging.getLogger(SystemController.__name__)
+    logger.info("powering off")
+    # exec skips all exit handlers - flush and close the log handlers now or the last lines are lost
+    logging.shutdown()
+    try:
+        os.execvp('sudo', ['sudo', 'shutdown', '-h', 'now'])  # doesn't return on success
+    except OSError as e:
+        logger.error("exec shutdown failed (%s), trying subprocess", e)
+        subprocess.run(['sudo', 'shutdown', '-h', 'now'])
+
 #MARK: SystemController
 class SystemController:
     """
@@ -32,21 +50,34 @@ class SystemController:
         self.bus = EventBus()
         self.logger = logging.getLogger(self.__class__.__name__)
         
+        # shared background writer for csv/jsonl logs
+        self.log_writer = LogWriter()
+        
         # create components
+        # kept eager on purpose: they subscribe to the bus in __init__ (lazy creation would miss events),
+        # and hardware libs (RPi.GPIO) are only imported inside the non-simulated code paths anyway
         self.state = StateManager(self.bus)
-        self.sensors = SensorReader(self.bus)
+        self.sensors = SensorReader(self.bus, self.log_writer)
         self.buttons = ButtonMonitor(self.bus)
         self.mmwave = MMWaveSensor(self.bus)
         self.audio = AudioManager(self.bus)
         self.conversation = ConversationManager(self.bus, self.audio)
         
         # subscribe to system events
-        self.bus.subscribe(ButtonPressEvent, self._handle_button)
-        self.bus.subscribe(ShutdownRequestEvent, self._handle_shutdown)
-        self.bus.subscribe(PresenceDetectedEvent, self._handle_presence_detected)
-        self.bus.subscribe(PresenceLostEvent, self._handle_presence_lost)
+        for event_type, handler in (
+            (ButtonPressEvent, self._handle_button),
+            (ShutdownRequestEvent, self._handle_shutdown),
+            (PresenceDetectedEvent, self._handle_presence_detected),
+            (PresenceLostEvent, self._handle_presence_lost),
+        ):
+            self.bus.subscribe(event_type, handler)
         
         self.running = True
+        # set by stop(), run() just waits on it instead of polling
+        self._stop_event = asyncio.Event()
+        self._loop = None
+        # set by _handle_shutdown, the entry point calls power_off() once the loop has finished
+        self.power_off_requested = False
         
     
     #MARK: handle presence
@@ -78,44 +109,40 @@ class SystemController:
         """shutdown the system"""
         self.logger.info("shutdown requested")
         
-        # end conversation gracefully
-        self.bus.publish(ConversationEndEvent())
+        # end conversation gracefully and cut off any audio right away
+        self.bus.publish_many((ConversationEndEvent(), InterruptAudioEvent()))
         self.state.change_state(SystemState.SHUTTING_DOWN)
         
         if not config.simulate_hardware:
-            # shutdown raspberry pi
-            subprocess.run(['sudo', 'shutdown', '-h', 'now'])
+            # actual power off happens after the event loop has finished (see power_off)
+            self.power_off_requested = True
         
         self.stop()
     
     def toggle(self):
         """pause/resume the system"""
         self.running = not self.running
-        self.logger.info(f"system {'running' if self.running else 'paused'}")
+        self.logger.info("system %s", "running" if self.running else "paused")
     
     async def run(self):
         """
         main run loop
         starts all components and keeps system running
         """
+        self._loop = asyncio.get_running_loop()
+        
         # start hardware threads
+        self.log_writer.start()
         self.sensors.start()
         self.buttons.start()
         self.mmwave.start()
         
         self.logger.info("system controller started")
         
-        # start event processor
-        event_task = asyncio.create_task(self.bus.process_events())
-        
         try:
-            # main loop
-            while self.running:
-                await asyncio.sleep(1)
-                
-                # could add health checks here
-                # if self.state.get_state() == SystemState.ERROR:
-                #     self.handle_error()
+            # main loop - sleeps until stop() is called
+            # health checks could be scheduled with loop.call_later
+            await self._stop_event.wait()
             
         except KeyboardInterrupt:
             self.logger.info("interrupted by user")
@@ -127,14 +154,25 @@ class SystemController:
         self.logger.info("cleaning up...")
         # Interrupt audio operations before stopping hardware threads
         self.bus.publish(InterruptAudioEvent())
-        # stop hardware threads
-        self.sensors.stop()
-        self.buttons.stop()
-        self.mmwave.running = False
+        await asyncio.sleep(0)  # let async subscribers see the interrupt first
+        # stop hardware threads - independent of each other, so stop them concurrently
+        # (csv flush and gpio cleanup can block, keep that off the event loop)
+        await asyncio.gather(
+            asyncio.to_thread(self.sensors.stop),
+            asyncio.to_thread(self.buttons.stop),
+            asyncio.to_thread(self.mmwave.stop),
+        )
         # final state
         self.state.change_state(SystemState.IDLE)
+        # write out remaining log entries last
+        self.log_writer.stop()
         self.logger.info("cleanup complete")
     
     def stop(self):
-        """stop the system"""
+        """stop the system (safe to call from hardware threads)"""
         self.running = False
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            self._stop_event.set()
+        else:
+            loop.call_soon_threadsafe(self._stop_event.set)
@@ -16,8 +16,15 @@ minimal code here - just starts the system
 
 import time
 import asyncio
+
+try:
+    # optional: libuv based event loop, less overhead per callback (linux/mac only)
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from tree_logger import setup_logging
-from system_controller import SystemController
+from system_controller import SystemController, power_off
 from debug_monitor import DebugMonitor
 
 #MARK: setup logging
@@ -34,17 +41,22 @@ logger = setup_logging(
 
 
 #MARK: main
-async def main():
-    """starts the various components"""
+async def main() -> bool:
+    """starts the various components, returns whether the system should power off"""
     logger.info("New Session")
     start = time.perf_counter() # used for runtime calc later, just stores the start time in variable
     
+    # run new tasks eagerly until their first await (python 3.12+)
+    # -> callbacks that return early never need a trip through the event loop
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    
     # creates the system controller
     # essentially controls everything
     controller = SystemController()
     
     # create debug monitor
-    monitor = DebugMonitor(controller.bus)
+    monitor = DebugMonitor(controller.bus, controller.log_writer)
     
     # run the system
     try:
@@ -54,9 +66,17 @@ async def main():
         raise
     finally:
         logger.info(f"voice assistant stopped. Total runtime: {(time.perf_counter() - start):.2f}s")
+    return controller.power_off_requested
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        # falls back to the default asyncio loop if uvloop isn't installed (e.g. on windows)
+        loop_factory = uvloop.new_event_loop if uvloop is not None else None
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            power_off_requested = runner.run(main())
     except KeyboardInterrupt:
-        logger.info("interrupted by user")
\ No newline at end of file
+        logger.info("interrupted by user")
+    else:
+        # outside the loop, everything is stopped and logged by now
+        if power_off_requested:
+            power_off()
\ No newline at end of file
@@ -4,10 +4,11 @@ Simplified Voice Assistant - Normal console output with side status panel
 """
 
 import asyncio
-import threading
 import time
 import random
+import re
 from datetime import datetime
+from collections import deque
 from dataclasses import dataclass
 from typing import Optional
 from enum import Enum
@@ -25,6 +26,33 @@ try:
 except ImportError:
     HAS_RICH = False
 
+# simulated phrases, built once instead of on every call
+SIMULATED_INPUTS = (
+    "Hello, how are you today?",
+    "What's the weather like outside?",
+    "Can you tell me a joke?",
+    "What time is it?",
+    "I'm doing well, thanks for asking",
+    "That's interesting, tell me more",
+    "Goodbye, see you later",
+)
+GREETINGS = (
+    "Hello there! It's great to see you.",
+    "Hi! How are you doing today?",
+    "Hello! What can I help you with?",
+)
+JOKES = (
+    "Why don't scientists trust atoms? Because they make up everything!",
+    "I told my wife she was drawing her eyebrows too high. She looked surprised.",
+    "What do you call a bear with no teeth? A gummy bear!",
+)
+FALLBACK_REPLIES = (
+    "You said: '{user_input}'. That's quite interesting!",
+    "I see. Can you tell me more about that?",
+    "That's fascinating. What made you think of that?",
+    "Hmm, I'm not sure I understand completely. Could you explain more?",
+)
+
 class State(Enum):
     IDLE = "Idle"
     LISTENING = "Listening"
@@ -39,9 +67,29 @@ class SystemStatus:
     humidity: float = 50.0
     conversation_active: bool = False
     last_speech: str = ""
-    uptime: float = 0.0
+    uptime: int = 0  # whole seconds, so it only changes the display once a second
 
 class SimpleVoiceAssistant:
+    # keyword -> intent, found with one regex scan of the input instead of an if/elif chain of `in` checks
+    _INTENT_RE = re.compile(r"\b(hello|hi|weather|joke|time|goodbye|bye)\b")
+    _INTENT_MAP = {
+        "hello": "greet", "hi": "greet",
+        "weather": "weather",
+        "joke": "joke",
+        "time": "time",
+        "goodbye": "bye", "bye": "bye",
+    }
+    
+    # (text, style) for the status cells that only have a few possible values
+    _STATE_CELLS = {
+        State.IDLE: ("Idle", "white"),
+        State.LISTENING: ("Listening", "yellow"),
+        State.THINKING: ("Processing", "blue"),
+        State.SPEAKING: ("Speaking", "green"),
+    }
+    _PRESENCE_CELLS = {True: ("YES", "green"), False: ("NO", "red")}
+    _CONVERSATION_CELLS = {True: ("ACTIVE", "green"), False: ("inactive", "dim")}
+    
     def __init__(self):
         self.status = SystemStatus()
         self.running = True
@@ -52,30 +100,33 @@ class SimpleVoiceAssistant:
         self.speech_timeout = 8
         self.greeting = "Hello! I noticed you're here. How can I help?"
         self.goodbye = "Goodbye! Have a great day!"
+
+        # set on presence changes, conversation end and shutdown - wakes _main_loop instead of polling
+        self._status_changed = asyncio.Event()
+        self._conversation_task: Optional[asyncio.Task] = None  # kept so shutdown can cancel it
         
         # Console output
         self.console = Console() if HAS_RICH else None
-        self.log_messages = []
+        self.log_messages = deque(maxlen=20)  # keeps only the last 20 messages
+        self._log_count = 0  # total messages logged, tells the display when the log changed
         
-        # Start background threads
-        self.presence_thread = threading.Thread(target=self._monitor_presence, daemon=True)
-        self.sensor_thread = threading.Thread(target=self._read_sensors, daemon=True)
+        # what the panels last showed, so unchanged panels aren't rebuilt
+        self._last_status_key = None
+        self._last_log_count = -1
+        
+        # status table is built once, each update only rewrites its cells
+        if HAS_RICH:
+            self._build_status_panel()
         
     def log(self, message: str, level: str = "INFO"):
         """Add a log message"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = time.strftime("%H:%M:%S")
         log_entry = f"[{timestamp}] {level}: {message}"
         self.log_messages.append(log_entry)
-        
-        # Keep only last 20 messages
-        if len(self.log_messages) > 20:
-            self.log_messages.pop(0)
+        self._log_count += 1
     
     def start(self):
-        """Start the assistant"""
-        self.presence_thread.start()
-        self.sensor_thread.start()
-        
+        """Start the assistant (background monitoring runs as tasks in _main_loop)"""
         if HAS_RICH:
             self._run_with_panel()
         else:
@@ -96,35 +147,42 @@ class SimpleVoiceAssistant:
             Layout(name="status", ratio=1)
         )
         
-        with Live(layout, refresh_per_second=2, console=self.console) as live:
+        # no auto refresh - _main_loop calls live.refresh() when a panel actually changed
+        with Live(layout, auto_refresh=False, console=self.console) as live:
             try:
                 asyncio.run(self._main_loop(live, layout))
             except KeyboardInterrupt:
                 self.console.print("\n[red]Shutting down...[/red]")
     
-    def _create_status_panel(self):
-        """Create the status panel"""
+    def _build_status_panel(self):
+        """Build the status table skeleton (columns, rows, panel) once"""
         table = Table(box=box.SIMPLE)
         table.add_column("Property", style="cyan", width=12)
         table.add_column("Value", style="white", width=15)
         
+        # one Text per value cell, updated in place by _create_status_panel
+        self._status_cells = {}
+        for name in ("State", "Presence", "Conversation", "Temperature", "Humidity", "Uptime"):
+            cell = Text()
+            table.add_row(name, cell)
+            self._status_cells[name] = cell
+        
+        self._status_panel = Panel(table, title="System Status", border_style="blue")
+    
+    def _create_status_panel(self):
+        """Update the status panel's cells and return it"""
+        cells = self._status_cells
+        
         # Status with colors
-        state_colors = {
-            State.IDLE: "white",
-            State.LISTENING: "yellow",
-            State.THINKING: "blue", 
-            State.SPEAKING: "green"
-        }
-        state_color = state_colors[self.status.state]
+        cells["State"].plain, cells["State"].style = self._STATE_CELLS[self.status.state]
+        cells["Presence"].plain, cells["Presence"].style = self._PRESENCE_CELLS[self.status.presence]
+        cells["Conversation"].plain, cells["Conversation"].style = self._CONVERSATION_CELLS[self.status.conversation_active]
         
-        table.add_row("State", f"[{state_color}]{self.status.state.value}[/{state_color}]")
-        table.add_row("Presence", "[green]YES[/green]" if self.status.presence else "[red]NO[/red]")
-        table.add_row("Conversation", "[green]ACTIVE[/green]" if self.status.conversation_active else "[dim]inactive[/dim]")
-        table.add_row("Temperature", f"{self.status.temperature:.1f}°C")
-        table.add_row("Humidity", f"{self.status.humidity:.0f}%")
-        table.add_row("Uptime", f"{self.status.uptime:.0f}s")
+        cells["Temperature"].plain = f"{self.status.temperature:.1f}°C"
+        cells["Humidity"].plain = f"{self.status.humidity:.0f}%"
+        cells["Uptime"].plain = f"{self.status.uptime}s"
         
-        return Panel(table, title="System Status", border_style="blue")
+        return self._status_panel
     
     def _create_log_panel(self):
         """Create the log panel"""
@@ -147,24 +205,53 @@ class SimpleVoiceAssistant:
         """Main application loop"""
         self.log("System started")
         
-        while self.running:
-            self.status.uptime = time.time() - self.start_time
-            
-            # Update display if using rich
-            if live and layout:
-                layout["status"].update(self._create_status_panel())
-                layout["logs"].update(self._create_log_panel())
-            
-            # Handle presence-based conversation
-            if self.status.presence and not self.status.conversation_active:
-                await self._start_conversation()
-            elif not self.status.presence and self.status.conversation_active:
-                await self._end_conversation()
-            
-            await asyncio.sleep(0.5)
+        # background monitors only sleep between checks, so tasks on this loop are enough (no threads)
+        monitors = [
+            asyncio.create_task(self._monitor_presence()),
+            asyncio.create_task(self._read_sensors()),
+        ]
+        try:
+            while self.running:
+                self.status.uptime = int(time.time() - self.start_time)
+                
+                # Update display if using rich - only the panels whose content changed
+                if live and layout:
+                    dirty = False
+                    status_key = (
+                        self.status.state, self.status.presence, self.status.conversation_active,
+                        round(self.status.temperature, 1), round(self.status.humidity), self.status.uptime
+                    )
+                    if status_key != self._last_status_key:
+                        self._last_status_key = status_key
+                        layout["status"].update(self._create_status_panel())
+                        dirty = True
+                    if self._log_count != self._last_log_count:
+                        self._last_log_count = self._log_count
+                        layout["logs"].update(self._create_log_panel())
+                        dirty = True
+                    if dirty:
+                        live.refresh()
+                
+                # Handle presence-based conversation
+                if self.status.presence and not self.status.conversation_active:
+                    await self._start_conversation()
+                elif not self.status.presence and self.status.conversation_active:
+                    await self._end_conversation()
+                
+                # sleep until presence/conversation changes, the display still needs its 0.5s tick
+                try:
+                    await asyncio.wait_for(self._status_changed.wait(), 0.5 if live else None)
+                except asyncio.TimeoutError:
+                    pass
+                self._status_changed.clear()
+        finally:
+            for task in monitors:
+                task.cancel()
+            if self._conversation_task is not None:
+                self._conversation_task.cancel()
 
     # Background monitoring
-    def _monitor_presence(self):
+    async def _monitor_presence(self):
         """Monitor presence sensor"""
         while self.running:
             old_presence = self.status.presence
@@ -175,21 +262,21 @@ class SimpleVoiceAssistant:
                     self.status.presence = not self.status.presence
                     if self.status.presence != old_presence:
                         self.log(f"Presence {'detected' if self.status.presence else 'lost'}")
+                        self._status_changed.set()
             
-            time.sleep(1)
+            await asyncio.sleep(1)
     
-    def _read_sensors(self):
+    async def _read_sensors(self):
         """Read environmental sensors"""
+        status = self.status
+        uniform = random.uniform
         while self.running:
             if self.simulate_hardware:
-                # Gradually changing values
-                self.status.temperature += random.uniform(-0.5, 0.5)
-                self.status.temperature = max(15, min(35, self.status.temperature))
-                
-                self.status.humidity += random.uniform(-2, 2)
-                self.status.humidity = max(20, min(80, self.status.humidity))
+                # Gradually changing values, random walk clamped to a plausible range
+                status.temperature = min(35.0, max(15.0, status.temperature + uniform(-0.5, 0.5)))
+                status.humidity = min(80.0, max(20.0, status.humidity + uniform(-2, 2)))
             
-            time.sleep(3)
+            await asyncio.sleep(3)
 
     # Conversation logic
     async def _start_conversation(self):
@@ -201,8 +288,9 @@ class SimpleVoiceAssistant:
         self.log("Starting conversation")
         await self._speak(self.greeting)
         
-        # Start conversation loop
-        asyncio.create_task(self._conversation_loop())
+        # Start conversation loop, _main_loop re-checks once it has ended
+        self._conversation_task = task = asyncio.create_task(self._conversation_loop())
+        task.add_done_callback(lambda _: self._status_changed.set())
     
     async def _conversation_loop(self):
         """Main conversation loop"""
@@ -254,17 +342,8 @@ class SimpleVoiceAssistant:
             
             # Random chance of getting speech
             if random.random() > 0.4:  # 60% chance
-                responses = [
-                    "Hello, how are you today?",
-                    "What's the weather like outside?",
-                    "Can you tell me a joke?",
-                    "What time is it?",
-                    "I'm doing well, thanks for asking",
-                    "That's interesting, tell me more",
-                    "Goodbye, see you later"
-                ]
                 self.status.state = State.IDLE
-                return random.choice(responses)
+                return random.choice(SIMULATED_INPUTS)
         
         self.status.state = State.IDLE
         return None
@@ -291,39 +370,41 @@ class SimpleVoiceAssistant:
             await asyncio.sleep(1)  # Simulate thinking time
             
             # Simple response logic
-            input_lower = user_input.lower()
-            if "hello" in input_lower or "hi" in input_lower:
-                responses = [
-                    "Hello there! It's great to see you.",
-                    "Hi! How are you doing today?",
-                    "Hello! What can I help you with?"
-                ]
-                return random.choice(responses)
-            elif "weather" in input_lower:
-                return f"Based on my sensors, it's {self.status.temperature:.1f} degrees with {self.status.humidity:.0f}% humidity here."
-            elif "joke" in input_lower:
-                jokes = [
-                    "Why don't scientists trust atoms? Because they make up everything!",
-                    "I told my wife she was drawing her eyebrows too high. She looked surprised.",
-                    "What do you call a bear with no teeth? A gummy bear!"
-                ]
-                return random.choice(jokes)
-            elif "time" in input_lower:
-                return f"The current time is {datetime.now().strftime('%I:%M %p')}."
-            elif "goodbye" in input_lower or "bye" in input_lower:
-                self.status.conversation_active = False
-                return "It was nice talking with you. Goodbye!"
-            else:
-                responses = [
-                    f"You said: '{user_input}'. That's quite interesting!",
-                    "I see. Can you tell me more about that?",
-                    "That's fascinating. What made you think of that?",
-                    "Hmm, I'm not sure I understand completely. Could you explain more?"
-                ]
-                return random.choice(responses)
+            match = self._INTENT_RE.search(user_input.lower())
+            intent = self._INTENT_MAP[match.group(1)] if match else None
+            return self._RESPONDERS[intent](self, user_input)
         
         self.status.state = State.IDLE
         return None
+    
+    # one responder per intent, picked via _RESPONDERS
+    def _respond_greet(self, user_input: str) -> str:
+        return random.choice(GREETINGS)
+    
+    def _respond_weather(self, user_input: str) -> str:
+        return f"Based on my sensors, it's {self.status.temperature:.1f} degrees with {self.status.humidity:.0f}% humidity here."
+    
+    def _respond_joke(self, user_input: str) -> str:
+        return random.choice(JOKES)
+    
+    def _respond_time(self, user_input: str) -> str:
+        return f"The current time is {datetime.now().strftime('%I:%M %p')}."
+    
+    def _respond_bye(self, user_input: str) -> str:
+        self.status.conversation_active = False
+        return "It was nice talking with you. Goodbye!"
+    
+    def _respond_other(self, user_input: str) -> str:
+        return random.choice(FALLBACK_REPLIES).format(user_input=user_input)
+    
+    _RESPONDERS = {
+        "greet": _respond_greet,
+        "weather": _respond_weather,
+        "joke": _respond_joke,
+        "time": _respond_time,
+        "bye": _respond_bye,
+        None: _respond_other,
+    }
 
 def main():
     assistant = SimpleVoiceAssistant()
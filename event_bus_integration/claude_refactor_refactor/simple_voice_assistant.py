@@ -5,9 +5,9 @@ No over-engineering, just what's needed to make it work
 """
 
 import asyncio
-import threading
 import time
 import random
+import re
 from datetime import datetime
 from dataclasses import dataclass
 from typing import Optional
@@ -23,6 +23,20 @@ try:
 except ImportError:
     HAS_RICH = False
 
+# simulated phrases, built once instead of on every call
+SIMULATED_INPUTS = (
+    "Hello, how are you?",
+    "What's the weather like?",
+    "Tell me a joke",
+    "What time is it?",
+    "Goodbye",
+)
+JOKES = (
+    "Why don't scientists trust atoms? Because they make up everything!",
+    "I told my wife she was drawing her eyebrows too high. She looked surprised.",
+    "Why don't eggs tell jokes? They'd crack each other up!",
+)
+
 class State(Enum):
     IDLE = "Idle"
     LISTENING = "Listening"
@@ -37,9 +51,29 @@ class SystemStatus:
     humidity: float = 0.0
     conversation_active: bool = False
     last_speech: str = ""
-    uptime: float = 0.0
+    uptime: int = 0  # whole seconds, so it only changes the display once a second
 
 class SimpleVoiceAssistant:
+    # keyword -> intent, found with one regex scan of the input instead of an if/elif chain of `in` checks
+    _INTENT_RE = re.compile(r"\b(hello|hi|weather|joke|time|goodbye|bye)\b")
+    _INTENT_MAP = {
+        "hello": "greet", "hi": "greet",
+        "weather": "weather",
+        "joke": "joke",
+        "time": "time",
+        "goodbye": "bye", "bye": "bye",
+    }
+    
+    # pre-rendered cells for the status values that only have a few possible states
+    _STATE_MARKUP = {
+        State.IDLE: "[white]Idle[/white]",
+        State.LISTENING: "[yellow]Listening[/yellow]",
+        State.THINKING: "[blue]Processing[/blue]",
+        State.SPEAKING: "[green]Speaking[/green]",
+    }
+    _PRESENCE_MARKUP = {True: "🟢 Detected", False: "🔴 None"}
+    _CONVERSATION_MARKUP = {True: "🟢 Active", False: "⚪ Inactive"}
+    
     def __init__(self):
         self.status = SystemStatus()
         self.running = True
@@ -50,18 +84,13 @@ class SimpleVoiceAssistant:
         self.speech_timeout = 8
         self.greeting = "Hello! I noticed you're here. How can I help?"
         self.goodbye = "Goodbye! Have a great day!"
-        
-        # Start background threads
-        self.presence_thread = threading.Thread(target=self._monitor_presence, daemon=True)
-        self.sensor_thread = threading.Thread(target=self._read_sensors, daemon=True)
-        self.button_thread = threading.Thread(target=self._monitor_buttons, daemon=True)
+
+        # set on presence changes, conversation end and shutdown - wakes _main_loop instead of polling
+        self._status_changed = asyncio.Event()
+        self._conversation_task: Optional[asyncio.Task] = None  # kept so shutdown can cancel it
         
     def start(self):
-        """Start all background monitoring"""
-        self.presence_thread.start()
-        self.sensor_thread.start() 
-        self.button_thread.start()
-        
+        """Start the assistant (background monitoring runs as tasks in _main_loop)"""
         if HAS_RICH:
             self._run_with_display()
         else:
@@ -72,7 +101,8 @@ class SimpleVoiceAssistant:
         """Run with rich live display"""
         console = Console()
         
-        with Live(self._create_display(), refresh_per_second=2, console=console) as live:
+        # no auto refresh - _main_loop refreshes when the status actually changed
+        with Live(self._create_display(), auto_refresh=False, console=console) as live:
             try:
                 asyncio.run(self._main_loop(live))
             except KeyboardInterrupt:
@@ -93,54 +123,73 @@ class SimpleVoiceAssistant:
         table.add_column("Value", style="green")
         
         # Status indicators
-        state_color = {
-            State.IDLE: "white",
-            State.LISTENING: "yellow", 
-            State.THINKING: "blue",
-            State.SPEAKING: "green"
-        }[self.status.state]
-        
-        table.add_row("State", f"[{state_color}]{self.status.state.value}[/{state_color}]")
-        table.add_row("Presence", "🟢 Detected" if self.status.presence else "🔴 None")
-        table.add_row("Conversation", "🟢 Active" if self.status.conversation_active else "⚪ Inactive")
+        table.add_row("State", self._STATE_MARKUP[self.status.state])
+        table.add_row("Presence", self._PRESENCE_MARKUP[self.status.presence])
+        table.add_row("Conversation", self._CONVERSATION_MARKUP[self.status.conversation_active])
         table.add_row("Temperature", f"{self.status.temperature:.1f}°C")
         table.add_row("Humidity", f"{self.status.humidity:.1f}%")
         table.add_row("Last Speech", self.status.last_speech[:50] + "..." if len(self.status.last_speech) > 50 else self.status.last_speech)
-        table.add_row("Uptime", f"{self.status.uptime:.1f}s")
+        table.add_row("Uptime", f"{self.status.uptime}s")
         
         return Panel(table, title="🤖 TreeBot", border_style="blue")
 
     async def _main_loop(self, live=None):
         """Main application loop"""
-        while self.running:
-            self.status.uptime = time.time() - self.start_time
-            
-            # Update display if using rich
-            if live:
-                live.update(self._create_display())
-            
-            # Handle presence-based conversation
-            if self.status.presence and not self.status.conversation_active:
-                await self._start_conversation()
-            elif not self.status.presence and self.status.conversation_active:
-                await self._end_conversation()
-            
-            await asyncio.sleep(0.5)
+        # background monitors only sleep between checks, so tasks on this loop are enough (no threads)
+        monitors = [
+            asyncio.create_task(self._monitor_presence()),
+            asyncio.create_task(self._read_sensors()),
+            asyncio.create_task(self._monitor_buttons()),
+        ]
+        last_display_key = None
+        try:
+            while self.running:
+                self.status.uptime = int(time.time() - self.start_time)
+                
+                # Update display if using rich - only when something shown has changed
+                if live:
+                    display_key = (
+                        self.status.state, self.status.presence, self.status.conversation_active,
+                        round(self.status.temperature, 1), round(self.status.humidity, 1),
+                        self.status.last_speech, self.status.uptime
+                    )
+                    if display_key != last_display_key:
+                        last_display_key = display_key
+                        live.update(self._create_display(), refresh=True)
+                
+                # Handle presence-based conversation
+                if self.status.presence and not self.status.conversation_active:
+                    await self._start_conversation()
+                elif not self.status.presence and self.status.conversation_active:
+                    await self._end_conversation()
+                
+                # sleep until presence/conversation changes, the display still needs its 0.5s tick
+                try:
+                    await asyncio.wait_for(self._status_changed.wait(), 0.5 if live else None)
+                except asyncio.TimeoutError:
+                    pass
+                self._status_changed.clear()
+        finally:
+            for task in monitors:
+                task.cancel()
+            if self._conversation_task is not None:
+                self._conversation_task.cancel()
 
-    # Background monitoring threads (simple, no events)
-    def _monitor_presence(self):
+    # Background monitoring tasks (simple, no events)
+    async def _monitor_presence(self):
         """Monitor presence sensor"""
         while self.running:
             if self.simulate_hardware:
                 # Simulate random presence changes
                 if random.random() > 0.98:  # 2% chance to change state
                     self.status.presence = not self.status.presence
+                    self._status_changed.set()
             else:
                 # Real sensor code would go here
                 pass
-            time.sleep(1)
+            await asyncio.sleep(1)
     
-    def _read_sensors(self):
+    async def _read_sensors(self):
         """Read environmental sensors"""
         while self.running:
             if self.simulate_hardware:
@@ -149,23 +198,20 @@ class SimpleVoiceAssistant:
             else:
                 # Real sensor code would go here
                 pass
-            time.sleep(5)  # Read every 5 seconds
+            await asyncio.sleep(5)  # Read every 5 seconds
     
-    def _monitor_buttons(self):
+    async def _monitor_buttons(self):
         """Monitor button presses"""
         while self.running:
             if self.simulate_hardware:
                 # Simulate occasional button press
                 if random.random() > 0.995:  # 0.5% chance
                     if random.random() > 0.5:
-                        asyncio.run_coroutine_threadsafe(
-                            self._handle_shutdown(), 
-                            asyncio.get_event_loop()
-                        )
+                        await self._handle_shutdown()
             else:
                 # Real GPIO code would go here
                 pass
-            time.sleep(0.1)
+            await asyncio.sleep(0.1)
 
     # Core conversation logic
     async def _start_conversation(self):
@@ -176,8 +222,9 @@ class SimpleVoiceAssistant:
         self.status.conversation_active = True
         await self._speak(self.greeting)
         
-        # Start conversation loop
-        asyncio.create_task(self._conversation_loop())
+        # Start conversation loop, _main_loop re-checks once it has ended
+        self._conversation_task = task = asyncio.create_task(self._conversation_loop())
+        task.add_done_callback(lambda _: self._status_changed.set())
     
     async def _conversation_loop(self):
         """Main conversation loop"""
@@ -217,14 +264,7 @@ class SimpleVoiceAssistant:
         if self.simulate_hardware:
             await asyncio.sleep(2)  # Simulate listening delay
             if random.random() > 0.3:  # 70% chance of getting input
-                responses = [
-                    "Hello, how are you?",
-                    "What's the weather like?", 
-                    "Tell me a joke",
-                    "What time is it?",
-                    "Goodbye"
-                ]
-                return random.choice(responses)
+                return random.choice(SIMULATED_INPUTS)
         else:
             # Real speech recognition would go here
             pass
@@ -254,36 +294,50 @@ class SimpleVoiceAssistant:
             await asyncio.sleep(1)  # Simulate API delay
             
             # Simple response logic
-            input_lower = user_input.lower()
-            if "hello" in input_lower or "hi" in input_lower:
-                return "Hello there! It's nice to meet you."
-            elif "weather" in input_lower:
-                return f"The temperature here is {self.status.temperature:.1f} degrees with {self.status.humidity:.1f}% humidity."
-            elif "joke" in input_lower:
-                jokes = [
-                    "Why don't scientists trust atoms? Because they make up everything!",
-                    "I told my wife she was drawing her eyebrows too high. She looked surprised.",
-                    "Why don't eggs tell jokes? They'd crack each other up!"
-                ]
-                return random.choice(jokes)
-            elif "time" in input_lower:
-                return f"The current time is {datetime.now().strftime('%I:%M %p')}."
-            elif "goodbye" in input_lower or "bye" in input_lower:
-                self.status.conversation_active = False
-                return "Goodbye! Have a wonderful day!"
-            else:
-                return f"I heard you say: '{user_input}'. That's interesting! Tell me more."
+            match = self._INTENT_RE.search(user_input.lower())
+            intent = self._INTENT_MAP[match.group(1)] if match else None
+            return self._RESPONDERS[intent](self, user_input)
         else:
             # Real AI API call would go here
             pass
         
         return None
     
+    # one responder per intent, picked via _RESPONDERS
+    def _respond_greet(self, user_input: str) -> str:
+        return "Hello there! It's nice to meet you."
+    
+    def _respond_weather(self, user_input: str) -> str:
+        return f"The temperature here is {self.status.temperature:.1f} degrees with {self.status.humidity:.1f}% humidity."
+    
+    def _respond_joke(self, user_input: str) -> str:
+        return random.choice(JOKES)
+    
+    def _respond_time(self, user_input: str) -> str:
+        return f"The current time is {datetime.now().strftime('%I:%M %p')}."
+    
+    def _respond_bye(self, user_input: str) -> str:
+        self.status.conversation_active = False
+        return "Goodbye! Have a wonderful day!"
+    
+    def _respond_other(self, user_input: str) -> str:
+        return f"I heard you say: '{user_input}'. That's interesting! Tell me more."
+    
+    _RESPONDERS = {
+        "greet": _respond_greet,
+        "weather": _respond_weather,
+        "joke": _respond_joke,
+        "time": _respond_time,
+        "bye": _respond_bye,
+        None: _respond_other,
+    }
+    
     # System control
     async def _handle_shutdown(self):
         """Handle shutdown request"""
         await self._speak("Shutting down. Goodbye!")
         self.running = False
+        self._status_changed.set()
 
 #MARK: main
 def main():
@@ -1,30 +1,53 @@
 import asyncio
+import contextlib
+import inspect
 import threading
-import queue
-from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List, Callable, Union
+import time
+from typing import Optional, Dict, Any, Callable, Tuple
 from datetime import datetime
 import logging
-from enum import Enum
 import weakref
-import random
-import json
-
-import logging
+from collections import deque
 
 # use module specific logger (needs to be set up in config)
 logger = logging.getLogger(__name__)
 
+MAX_QUEUED_EVENTS = 8192  # events waiting for async subscribers, newer ones are dropped beyond this
+
+
+def _make_weakref(callback: Callable) -> weakref.ref:
+    """
+    WeakMethod for bound methods (handlers inside classes), weakref.ref for functions
+    (a plain weakref to a bound method would die immediately)
+    """
+    if inspect.ismethod(callback):
+        return weakref.WeakMethod(callback)
+    return weakref.ref(callback)
+
 #MARK:
 class Event:
     """
     Base class for all events in the system.
     Using a class hierarchy makes it easy to filter and handle specific event types.
     """
+    event_type = "Event"  # class name, set once per class by __init_subclass__ instead of per instance
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.event_type = cls.__name__
+    
     def __init__(self, data: Any = None):
-        self.timestamp = datetime.now()
+        # plain int, much cheaper than datetime.now() on every publish
+        self.timestamp_ns = time.time_ns()
+        self._timestamp = None  # datetime, only created when needed
         self.data = data
-        self.event_type = self.__class__.__name__
+    
+    @property
+    def timestamp(self) -> datetime:
+        """time of the event as (local) datetime"""
+        if self._timestamp is None:
+            self._timestamp = datetime.fromtimestamp(self.timestamp_ns / 1e9)
+        return self._timestamp
     
     def __repr__(self):
         return f"{self.event_type}(data={self.data}, time={self.timestamp})"
@@ -81,19 +104,35 @@ class EventBus:
     """
    
     def __init__(self):
-        # Dictionary mapping event types to list of callbacks
+        # Dictionary mapping event types to a tuple of callbacks
         # Using weakref.WeakMethod to automatically clean up when objects are deleted
-        self._subscribers: Dict[type, List[weakref.ref]] = {}
+        # Tuples are replaced, never changed, so publish can iterate them without copying
+        self._subscribers: Dict[type, Tuple[weakref.ref, ...]] = {}
+        # guards replacing the subscriber tuples (publish runs on several threads)
+        self._lock = threading.Lock()
+        # per-thread queue of events published from inside subscribers (see _pump)
+        self._pump_state = threading.local()
+        
+        # Hands events from publish() to process_events() without polling.
+        # Other threads put through loop.call_soon_threadsafe (asyncio.Queue isn't thread-safe)
+        # Bounded, so a runaway producer can't grow it without limit (see _put_or_drop)
+        self._event_queue: asyncio.Queue = asyncio.Queue(maxsize=MAX_QUEUED_EVENTS)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.dropped_events = 0  # events not queued because the queue was full
         
-        # For thread-safe operation between async and sync code
-        self._event_queue = queue.Queue()
+        # process_events runs as this task, started by the first async subscribe
+        self._dispatcher_task: Optional[asyncio.Task] = None
+        self._running = True
         
-        # For async subscribers
-        self._async_subscribers: Dict[type, List[Callable]] = {}
+        # For async subscribers - same copy-on-write tuples, read without the lock
+        self._async_subscribers: Dict[type, Tuple[Callable, ...]] = {}
         
-        # Event history for debugging
-        self.event_history: List[Event] = []
+        # sync callbacks for every event type (subscribe_all), also copy-on-write
+        self._wildcard_subscribers: Tuple[weakref.ref, ...] = ()
+        
+        # Event history for debugging (deque drops the oldest entry itself)
         self.max_history = 100
+        self.event_history: deque = deque(maxlen=self.max_history)
     
     def subscribe(self, event_type: type, callback: Callable):
         """
@@ -103,97 +142,212 @@ class EventBus:
             event_type: The Event class to subscribe to
             callback: Function to call when event occurs
         """
+        debug = logger.isEnabledFor(logging.DEBUG)  # skip the attribute lookups for the debug args otherwise
+        
         # Determine if callback is async or sync
         if asyncio.iscoroutinefunction(callback):
             # Async callback
-            if event_type not in self._async_subscribers:
-                self._async_subscribers[event_type] = []
-            self._async_subscribers[event_type].append(callback)
-            logger.debug(f"Async subscription: {callback.__name__} -> {event_type.__name__}")
+            with self._lock:
+                self._async_subscribers[event_type] = self._async_subscribers.get(event_type, ()) + (callback,)
+            self._ensure_dispatcher()
+            if debug:
+                logger.debug("Async subscription: %s -> %s", callback.__name__, event_type.__name__)
         else:
             # Sync callback - use weakref to avoid memory leaks
-            if event_type not in self._subscribers:
-                self._subscribers[event_type] = []
-            
-            # Create weak reference to the callback
             # This prevents memory leaks if subscriber forgets to unsubscribe
-            weak_callback = weakref.ref(callback)
-            self._subscribers[event_type].append(weak_callback)
-            logger.debug(f"Sync subscription: {callback.__name__} -> {event_type.__name__}")
+            weak_callback = _make_weakref(callback)
+            with self._lock:
+                self._subscribers[event_type] = self._subscribers.get(event_type, ()) + (weak_callback,)
+            if debug:
+                logger.debug("Sync subscription: %s -> %s", callback.__name__, event_type.__name__)
+    
+    def subscribe_all(self, callback: Callable):
+        """
+        Subscribe a sync callback to every event type (including ones added later).
+        
+        Args:
+            callback: Function to call for each published event
+        """
+        weak_callback = _make_weakref(callback)
+        with self._lock:
+            self._wildcard_subscribers = self._wildcard_subscribers + (weak_callback,)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Wildcard subscription: %s", callback.__name__)
     
     def publish(self, event: Event):
         """
         Publish an event to all subscribers.
         Can be called from both sync and async contexts.
+        Events published from inside a subscriber are delivered after the current one (FIFO).
+        """
+        self._pump(event, enqueue_async=True)
+    
+    def _pump(self, event: Event, enqueue_async: bool):
         """
+        Deliver event to the sync subscribers, then whatever they published meanwhile.
+        The outermost publish on a thread drains a per-thread queue, nested publishes only
+        append to it - no recursion through handlers, order stays the publish order.
+        """
+        pending = getattr(self._pump_state, 'pending', None)
+        if pending is not None:
+            pending.append(event)  # nested publish, the running pump picks it up
+            return
+        
+        self._pump_state.pending = pending = deque()
+        try:
+            while True:
+                event_type = type(event)  # looked up once, used for both subscriber dicts
+                self._record(event)
+                self._dispatch_sync(event, event_type)
+                
+                # Queue event for async processing - most event types have no async subscribers,
+                # don't wake process_events for those
+                if enqueue_async and event_type in self._async_subscribers:
+                    self._enqueue(event)
+                
+                if not pending:
+                    break
+                event = pending.popleft()
+                enqueue_async = True  # nested events always go through the queue
+        finally:
+            self._pump_state.pending = None
+    
+    def _record(self, event: Event):
+        """store event in history and log it"""
         # Store in history for debugging
         self.event_history.append(event)
-        if len(self.event_history) > self.max_history:
-            self.event_history.pop(0)
         
-        logger.info(f"Event published: {event}")
+        # %-style: repr(event) is only built if the record is actually emitted
+        logger.info("Event published: %r", event)
+    
+    def _dispatch_sync(self, event: Event, event_type: type):
+        """call the sync subscribers of event"""
+        weak_callbacks = self._subscribers.get(event_type)
+        if weak_callbacks:
+            # Call alive callbacks, the tuple is only rebuilt if a reference died
+            found_dead = False
+            for weak_callback in weak_callbacks:
+                callback = weak_callback()
+                if callback is None:
+                    found_dead = True
+                    continue
+                try:
+                    callback(event)
+                except Exception as e:
+                    logger.error("Error in sync callback: %s", e)
+            
+            if found_dead:
+                self._prune_dead(event_type)
         
-        # Handle sync subscribers
-        event_type = type(event)
-        if event_type in self._subscribers:
-            # Clean up dead references and call alive ones
-            alive_callbacks = []
-            for weak_callback in self._subscribers[event_type]:
+        # Handle wildcard subscribers (one tuple for all event types)
+        if self._wildcard_subscribers:
+            found_dead = False
+            for weak_callback in self._wildcard_subscribers:
                 callback = weak_callback()
-                if callback is not None:
-                    alive_callbacks.append(weak_callback)
-                    try:
-                        callback(event)
-                    except Exception as e:
-                        logger.error(f"Error in sync callback: {e}")
+                if callback is None:
+                    found_dead = True
+                    continue
+                try:
+                    callback(event)
+                except Exception as e:
+                    logger.error("Error in wildcard callback: %s", e)
             
-            # Update list with only alive callbacks
-            self._subscribers[event_type] = alive_callbacks
+            if found_dead:
+                with self._lock:
+                    self._wildcard_subscribers = tuple(
+                        weak_callback for weak_callback in self._wildcard_subscribers
+                        if weak_callback() is not None
+                    )
+    
+    async def _dispatch_async(self, event: Event):
+        """run the async subscribers of event concurrently and wait for all of them"""
+        callbacks = self._async_subscribers.get(type(event))
+        if not callbacks:
+            return
+        # gather schedules the coroutines itself
+        results = await asyncio.gather(*(callback(event) for callback in callbacks), return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Error in async callback: %s", result)
+    
+    def _enqueue(self, event: Event):
+        """put event on the async queue, from the loop or from any other thread"""
+        try:
+            asyncio.get_running_loop()
+            on_loop = True
+        except RuntimeError:
+            on_loop = False
         
-        # Queue event for async processing
-        self._event_queue.put(event)
+        if on_loop or self._loop is None:
+            # on the loop, or process_events hasn't started yet (nobody is waiting)
+            self._put_or_drop(event)
+        elif not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._put_or_drop, event)
+    
+    def _put_or_drop(self, event: Event):
+        """queue event for process_events, drop it if the queue is full (publishers never wait)"""
+        try:
+            self._event_queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.dropped_events += 1
+            if self.dropped_events % 1000 == 1:  # first drop and then every 1000th, not one line per event
+                logger.warning("Event queue full, dropped %d events so far (latest: %s)",
+                               self.dropped_events, type(event).__name__)
+    
+    def _prune_dead(self, event_type: type):
+        """drop subscriptions whose objects have been garbage collected"""
+        with self._lock:
+            self._subscribers[event_type] = tuple(
+                weak_callback for weak_callback in self._subscribers[event_type]
+                if weak_callback() is not None
+            )
     
     async def async_publish(self, event: Event):
         """
         Async version of publish - ensures async subscribers are called properly.
+        Async subscribers are awaited here directly, the event doesn't go through the queue
+        (that would have process_events call them a second time).
         """
-        self.publish(event)  # Handle sync subscribers first
-        
-        # Handle async subscribers
-        event_type = type(event)
-        if event_type in self._async_subscribers:
-            # Create tasks for all async callbacks
-            tasks = []
-            for callback in self._async_subscribers[event_type]:
-                tasks.append(asyncio.create_task(callback(event)))
-            
-            # Wait for all callbacks to complete
-            if tasks:
-                await asyncio.gather(*tasks, return_exceptions=True)
+        self._ensure_dispatcher()
+        self._pump(event, enqueue_async=False)  # Handle sync subscribers first
+        await self._dispatch_async(event)
+    
+    def _ensure_dispatcher(self):
+        """start process_events as a background task, once there is a running loop"""
+        if self._dispatcher_task is not None or not self._running:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # subscribed outside the loop - next async subscribe/publish on the loop starts it
+        self._dispatcher_task = loop.create_task(self.process_events(), name="EventBus.dispatcher")
+    
+    async def shutdown(self):
+        """stop the dispatcher task and wait until it's gone"""
+        self._running = False
+        task, self._dispatcher_task = self._dispatcher_task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
     
     async def process_events(self):
         """
         Process queued events in async context.
-        This bridges the sync/async worlds.
+        This bridges the sync/async worlds - only publish() queues events, async_publish() dispatches itself.
         """
-        while True:
+        self._loop = asyncio.get_running_loop()
+        while self._running:
             try:
-                # Non-blocking check for events
-                if not self._event_queue.empty():
-                    event = self._event_queue.get_nowait()
-                    
-                    # Process async subscribers
-                    event_type = type(event)
-                    if event_type in self._async_subscribers:
-                        for callback in self._async_subscribers[event_type]:
-                            try:
-                                await callback(event)
-                            except Exception as e:
-                                logger.error(f"Error in async callback: {e}")
+                # sleeps until something is published, no polling
+                event = await self._event_queue.get()
                 
-                await asyncio.sleep(0.01)  # Small delay to prevent CPU spinning
-            except queue.Empty:
-                await asyncio.sleep(0.01)
+                # Process async subscribers (one dict lookup, the tuple is never empty)
+                for callback in self._async_subscribers.get(type(event), ()):
+                    try:
+                        await callback(event)
+                    except Exception as e:
+                        logger.error("Error in async callback: %s", e)
             except Exception as e:
-                logger.error(f"Error processing events: {e}")
+                logger.error("Error processing events: %s", e)
                 
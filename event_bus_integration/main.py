@@ -28,6 +28,19 @@ from enum import Enum
 import weakref
 import random
 import json
+import time
+
+try:
+    # optional: much faster json encoder, handles datetime/dataclass/enum natively and returns bytes
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # optional: libuv based event loop, less overhead per callback (linux/mac only)
+    import uvloop
+except ImportError:
+    uvloop = None
 
 from tree_logger import setup_logging, TreeLogger
 
@@ -70,10 +83,10 @@ event_bus = EventBus()
 
 # ============= SHARED STATE WITH EVENT NOTIFICATIONS =============
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 #MARK:
 class SensorData:
-    """Data class for sensor readings"""
+    """Data class for sensor readings (one per reading, immutable once published - no per-instance __dict__)"""
     temperature: float
     humidity: float
     timestamp: datetime
@@ -89,6 +102,8 @@ class SystemState(Enum):
     CONVERSATION_ACTIVE = "conversation_active"
     SHUTTING_DOWN = "shutting_down"
 
+PRESENCE_MIN_DWELL = 1.5  # seconds a presence state has to last before the next change is applied
+
 #MARK:
 class StateManager:
     """
@@ -103,6 +118,12 @@ class StateManager:
         self.presence_detected = False
         self.metrics: Dict[str, Any] = {}
         
+        # presence hysteresis: a change within PRESENCE_MIN_DWELL of the last one is held back
+        # and dropped if the sensor flips back in the meantime (no state/conversation churn)
+        self._presence_since = 0.0  # time.monotonic() of the last applied change
+        self._presence_timer: Optional[threading.Timer] = None
+        self._presence_lock = threading.Lock()  # handlers run on the sensor thread, the timer on its own
+        
         # Subscribe to relevant events to update state
         bus.subscribe(SensorDataEvent, self.handle_sensor_data)
         bus.subscribe(PresenceDetectedEvent, self.handle_presence_detected)
@@ -113,17 +134,38 @@ class StateManager:
     def handle_sensor_data(self, event: SensorDataEvent):
         """Update sensor data from event"""
         self.sensor_data = event.data
-        self.metrics['last_sensor_update'] = datetime.now()
+        self.metrics['last_sensor_update'] = time.monotonic()  # only compared for recency, no wall clock needed
+        self.metrics['dropped_events'] = self.bus.dropped_events
     
     def handle_presence_detected(self, event: PresenceDetectedEvent):
         """Update presence state"""
-        self.presence_detected = True
-        self.change_state(SystemState.IDLE)
+        self._presence_changed(True)
     
     def handle_presence_lost(self, event: PresenceLostEvent):
         """Update presence state"""
-        self.presence_detected = False
-        if self.conversation_active:
+        self._presence_changed(False)
+    
+    def _presence_changed(self, present: bool):
+        """Apply a presence change, or hold it back until PRESENCE_MIN_DWELL has passed"""
+        with self._presence_lock:
+            if self._presence_timer is not None:
+                self._presence_timer.cancel()
+                self._presence_timer = None
+            if present == self.presence_detected:
+                return  # flipped back before the pending change was applied
+            wait = self._presence_since + PRESENCE_MIN_DWELL - time.monotonic()
+            if wait > 0:
+                self._presence_timer = threading.Timer(wait, self._presence_changed, (present,))
+                self._presence_timer.daemon = True
+                self._presence_timer.start()
+                return
+            self.presence_detected = present
+            self._presence_since = time.monotonic()
+        
+        # publish outside the lock, subscribers may publish presence events again
+        if present:
+            self.change_state(SystemState.IDLE)
+        elif self.conversation_active:
             self.bus.publish(ConversationEndEvent())
     
     def handle_conversation_start(self, event: ConversationStartEvent):
@@ -146,18 +188,28 @@ class StateManager:
         }))
 
 # ============= HARDWARE COMPONENTS (THREADING) =============
+CSV_FLUSH_EVERY = 16  # sensor rows buffered before they're flushed to sensor_data.csv
+
 #MARK: class: SensorReader
 class SensorReader(threading.Thread):
     """
     Reads sensors in a separate thread and publishes data via event bus.
     This keeps blocking I/O operations from affecting the main event loop.
     """
+    logger = logging.getLogger(__qualname__)  # bound once per class, self.logger still works
+    
     def __init__(self, bus: EventBus, interval: int = 60):
         super().__init__(daemon=True)  # Daemon thread dies when main program exits
         self.bus = bus
         self.interval = interval
         self.running = True
-        self.logger = logging.getLogger(self.__class__.__name__)
+        
+        # kept open instead of reopening per reading, flushed every CSV_FLUSH_EVERY rows and on stop()
+        self._csv = open('sensor_data.csv', 'a', buffering=65536)
+        self._csv_lock = threading.Lock()  # stop() runs on another thread
+        self._since_flush = 0
+        # set on stop(), wakes the thread immediately instead of waiting out the interval
+        self._stop_event = threading.Event()
     
     def run(self):
         """Main thread loop"""
@@ -187,20 +239,31 @@ class SensorReader(threading.Thread):
                 self.logger.error(f"Error reading sensors: {e}")
             
             # Wait for next reading
-            threading.Event().wait(self.interval)
+            if self._stop_event.wait(self.interval):
+                break  # stopped
     
     def save_to_csv(self, data: SensorData):
         """Save sensor data to CSV file"""
         # In production, use proper CSV library and handle file locking
         try:
-            with open('sensor_data.csv', 'a') as f:
-                f.write(f"{data.timestamp},{data.temperature},{data.humidity}\n")
+            with self._csv_lock:
+                if self._csv.closed:
+                    return
+                # same row format as before - the file is appended to, existing rows stay as they are
+                self._csv.write(f"{data.timestamp},{data.temperature},{data.humidity}\n")
+                self._since_flush += 1
+                if self._since_flush >= CSV_FLUSH_EVERY:
+                    self._csv.flush()
+                    self._since_flush = 0
         except Exception as e:
             self.logger.error(f"Failed to save to CSV: {e}")
     
     def stop(self):
         """Stop the sensor reading thread"""
         self.running = False
+        self._stop_event.set()
+        with self._csv_lock:
+            self._csv.close()  # flushes what's still buffered
 
 #MARK: class ButtonMonitor
 class ButtonMonitor(threading.Thread):
@@ -208,14 +271,16 @@ class ButtonMonitor(threading.Thread):
     Monitors GPIO buttons and publishes button press events.
     Uses interrupts in real implementation.
     """
+    logger = logging.getLogger(__qualname__)
+    
     def __init__(self, bus: EventBus):
         super().__init__(daemon=True)
         self.bus = bus
         self.running = True
-        self.logger = logging.getLogger(self.__class__.__name__)
+        self._stop_event = threading.Event()  # set on stop(), ends the simulation wait right away
+        self._gpio = None  # RPi.GPIO module once edge detection is set up
         
         # Button configuration
-        # In real implementation: GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
         self.buttons = {
             'shutdown': 17,     # GPIO pin 17
             'stop_start': 27,   # GPIO pin 27
@@ -226,62 +291,110 @@ class ButtonMonitor(threading.Thread):
         """Setup GPIO interrupts and wait for events"""
         self.logger.info("Button monitor started")
         
-        # In real implementation:
-        # for button, pin in self.buttons.items():
-        #     GPIO.add_event_detect(pin, GPIO.FALLING, 
-        #                          callback=lambda p: self.button_pressed(button),
-        #                          bouncetime=200)
+        if self._setup_gpio():
+            # edge detection calls button_pressed from the GPIO library's thread,
+            # this one just sleeps until stop() - no polling, no wakeups
+            self._stop_event.wait()
+            return
         
-        # Simulation loop
+        # Simulation loop (no GPIO) - the wait ends right away on stop()
         while self.running:
-            threading.Event().wait(10)  # Check every 10 seconds
+            if self._stop_event.wait(10):  # Check every 10 seconds
+                break  # stopped
             
             # Simulate random button press for testing
             if random.random() > 0.9:
                 button = random.choice(list(self.buttons.keys()))
                 self.button_pressed(button)
     
+    def _setup_gpio(self) -> bool:
+        """Register falling-edge interrupts for all buttons, False if there's no GPIO (simulate)"""
+        try:
+            import RPi.GPIO as GPIO
+        except ImportError:
+            return False
+        try:
+            GPIO.setmode(GPIO.BCM)
+            for button, pin in self.buttons.items():
+                GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+                GPIO.add_event_detect(pin, GPIO.FALLING,
+                                      callback=lambda p, button=button: self.button_pressed(button),
+                                      bouncetime=200)
+        except Exception as e:  # e.g. not running on a pi
+            self.logger.warning(f"GPIO setup failed, simulating buttons: {e}")
+            return False
+        self._gpio = GPIO
+        return True
+    
     def button_pressed(self, button_type: str):
         """Handle button press interrupt"""
         self.logger.info(f"Button pressed: {button_type}")
         self.bus.publish(ButtonPressEvent(button_type))
+    
+    def stop(self):
+        """Stop the button monitor thread"""
+        self.running = False
+        self._stop_event.set()
+        if self._gpio is not None:
+            self._gpio.cleanup()
 
 #MARK: class MMWAVESensor
 # moved to own file 
 from mmwave_sensor import MMWaveSensor
 
 # ============= AUDIO COMPONENTS =============
+SPEECH_JOINER = " ... "  # pause between utterances played together (plain text, not every TTS takes SSML <break>)
+
 #MARK:
 class AudioManager:
     """
     Manages audio input/output using event-driven architecture.
     Bridges between blocking audio operations and async world.
     """
+    logger = logging.getLogger(__qualname__)
+    
     def __init__(self, bus: EventBus):
         self.bus = bus
         self.is_playing = False
         self.is_listening = False
-        self.logger = logging.getLogger(self.__class__.__name__)
+        # set on stop(), cuts simulated playback/listening short
+        self._stop_event = threading.Event()
         
         # Subscribe to speech events
         bus.subscribe(AssistantSpeechEvent, self.handle_assistant_speech)
         
-        # Audio threads for blocking operations
-        self.play_thread: Optional[threading.Thread] = None
-        self.listen_thread: Optional[threading.Thread] = None
+        # One long-lived playback thread fed through a queue, instead of a new thread per utterance
+        self._play_queue: queue.Queue = queue.Queue()
+        self.play_thread = threading.Thread(target=self._play_worker, daemon=True)
+        self.play_thread.start()
     
     def handle_assistant_speech(self, event: AssistantSpeechEvent):
-        """Handle request to speak"""
-        if not self.is_playing:
-            # Start playback in separate thread to avoid blocking
-            self.play_thread = threading.Thread(
-                target=self._play_audio,
-                args=(event.data,)
-            )
-            self.play_thread.start()
+        """Handle request to speak (played in order by the playback thread)"""
+        self._play_queue.put_nowait(event.data)
+    
+    def _play_worker(self):
+        """
+        Playback thread: play queued texts one after another, None (from stop()) ends it.
+        Texts that queued up while something was playing (e.g. an answer and its followup)
+        are joined into one playback, so they cost one TTS request instead of several.
+        """
+        while True:
+            texts = [self._play_queue.get()]
+            while True:
+                try:
+                    texts.append(self._play_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            stopping = None in texts
+            texts = [text for text in texts if text is not None]
+            if texts and not stopping:
+                self._play_audio(SPEECH_JOINER.join(texts))
+            if stopping:
+                return
     
     def _play_audio(self, text: str):
-        """Blocking audio playback (runs in thread)"""
+        """Blocking audio playback (runs in the playback thread)"""
         self.is_playing = True
         self.logger.info(f"Playing: {text}")
         
@@ -291,13 +404,35 @@ class AudioManager:
             # 2. Play audio through speaker
             # For now, simulate with sleep
             duration = len(text) * 0.05  # Rough estimate
-            threading.Event().wait(duration)
+            self._stop_event.wait(duration)
             
         except Exception as e:
             self.logger.error(f"Error playing audio: {e}")
         finally:
             self.is_playing = False
     
+    def _blocking_listen(self) -> Optional[str]:
+        """Blocking listen operation (runs in the default executor)"""
+        self.is_listening = True
+        self.logger.info("Listening for speech...")
+        
+        try:
+            # Real implementation would:
+            # 1. Record audio from microphone
+            # 2. Send to speech-to-text API
+            # For now, simulate
+            self._stop_event.wait(2)
+            
+            # Simulate speech detection
+            if random.random() > 0.3:
+                return "Hello, how are you today?"
+            return None
+        except Exception as e:
+            self.logger.error(f"Error listening: {e}")
+            return None
+        finally:
+            self.is_listening = False
+    
     async def listen_for_speech(self, timeout: int = 10) -> Optional[str]:
         """
         Start listening for speech (async wrapper).
@@ -306,51 +441,9 @@ class AudioManager:
         if self.is_listening:
             return None
         
-        # Use future to bridge threading and async
-        future = asyncio.Future()
-        
-        def _listen():
-            """Blocking listen operation"""
-            self.is_listening = True
-            self.logger.info("Listening for speech...")
-            
-            try:
-                # Real implementation would:
-                # 1. Record audio from microphone
-                # 2. Send to speech-to-text API
-                # For now, simulate
-                threading.Event().wait(2)
-                
-                # Simulate speech detection
-                if random.random() > 0.3:
-                    text = "Hello, how are you today?"
-                    # Set result in main thread
-                    asyncio.run_coroutine_threadsafe(
-                        self._set_future_result(future, text),
-                        asyncio.get_event_loop()
-                    )
-                else:
-                    asyncio.run_coroutine_threadsafe(
-                        self._set_future_result(future, None),
-                        asyncio.get_event_loop()
-                    )
-                    
-            except Exception as e:
-                self.logger.error(f"Error listening: {e}")
-                asyncio.run_coroutine_threadsafe(
-                    self._set_future_result(future, None),
-                    asyncio.get_event_loop()
-                )
-            finally:
-                self.is_listening = False
-        
-        # Start listening in thread
-        self.listen_thread = threading.Thread(target=_listen)
-        self.listen_thread.start()
-        
-        # Wait for result with timeout
+        # to_thread reuses the loop's executor threads and hands the result back to the loop
         try:
-            result = await asyncio.wait_for(future, timeout=timeout)
+            result = await asyncio.wait_for(asyncio.to_thread(self._blocking_listen), timeout=timeout)
             if result:
                 # Publish user speech event
                 self.bus.publish(UserSpeechEvent(result))
@@ -359,10 +452,10 @@ class AudioManager:
             self.logger.info("Listen timeout")
             return None
     
-    async def _set_future_result(self, future: asyncio.Future, result: Any):
-        """Helper to set future result from thread"""
-        if not future.done():
-            future.set_result(result)
+    def stop(self):
+        """Interrupt any running playback or listening and end the playback thread"""
+        self._stop_event.set()
+        self._play_queue.put_nowait(None)
 
 # ============= CONVERSATION MANAGEMENT =============
 #MARK:
@@ -371,43 +464,78 @@ class ConversationManager:
     Manages AI conversation flow using event-driven patterns.
     Handles the complex conversation logic and state.
     """
-    def __init__(self, bus: EventBus):
+    logger = logging.getLogger(__qualname__)
+    
+    def __init__(self, bus: EventBus, audio_manager: AudioManager):
         self.bus = bus
         self.active = False
-        self.logger = logging.getLogger(self.__class__.__name__)
         
         # Response management
         self.immediate_response: Optional[str] = None
         self.followup_response: Optional[str] = None
-        self.last_interaction = datetime.now()
+        self.last_interaction = time.monotonic()  # monotonic: immune to clock changes
+        # pending followup, cancelled by the next query or the end of the conversation
+        self._followup_task: Optional[asyncio.Task] = None
+        # loop the conversation and followup tasks run on - sync handlers called from the
+        # hardware threads hand their work over to it (also set by start_conversation/process_query)
+        try:
+            self._loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
         
         # Subscribe to events
         bus.subscribe(PresenceDetectedEvent, self.handle_presence)
-        bus.subscribe(UserSpeechEvent, self.handle_user_speech)
+        # no UserSpeechEvent subscription: conversation_loop processes what it heard itself,
+        # the event is only for monitoring (handling it here too answered every query twice)
         bus.subscribe(ConversationEndEvent, self.handle_end)
         
-        # For async operations
-        self.audio_manager = AudioManager(bus)
+        # For async operations (shared with the SystemController - one instance plays each utterance once)
+        self.audio_manager = audio_manager
     
     def handle_presence(self, event: PresenceDetectedEvent):
-        """Start conversation when presence detected"""
-        if not self.active:
-            # Start conversation in async context
-            asyncio.create_task(self.start_conversation())
-    
-    async def handle_user_speech(self, event: UserSpeechEvent):
-        """Process user speech"""
+        """
+        Start conversation when presence detected.
+        Published from the mmWave thread - the conversation is then started on the loop.
+        """
         if self.active:
-            await self.process_query(event.data)
+            return
+        loop = self._loop
+        try:
+            on_loop = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            self.active = True  # set right away, a second presence event mustn't start another one
+            loop.create_task(self.start_conversation())
+        elif loop is not None and not loop.is_closed():
+            self.active = True
+            asyncio.run_coroutine_threadsafe(self.start_conversation(), loop)
+        else:
+            self.logger.warning("No event loop yet, presence ignored")
     
     def handle_end(self, event: ConversationEndEvent):
-        """Clean up when conversation ends"""
+        """
+        Clean up when conversation ends.
+        Published from sensor/button/timer threads too - the followup task is then
+        cancelled on its own loop, asyncio tasks aren't thread-safe.
+        """
         self.active = False
+        loop = self._loop
+        if loop is not None:
+            try:
+                on_loop = asyncio.get_running_loop() is loop
+            except RuntimeError:
+                on_loop = False
+            if on_loop:
+                self._cancel_followup()
+            elif not loop.is_closed():
+                loop.call_soon_threadsafe(self._cancel_followup)
         self.logger.info("Conversation ended")
     
     async def start_conversation(self):
         """Initialize a new conversation"""
         self.active = True
+        self._loop = asyncio.get_running_loop()
         self.bus.publish(ConversationStartEvent())
         
         # Generate greeting (replace with OpenAI call)
@@ -426,6 +554,10 @@ class ConversationManager:
         This would integrate with OpenAI API.
         """
         self.logger.info(f"Processing: {query}")
+        self._loop = asyncio.get_running_loop()
+        
+        # a new query makes the previous followup irrelevant
+        self._cancel_followup()
         
         # Simulate API call to generate both responses
         await asyncio.sleep(0.5)
@@ -438,21 +570,25 @@ class ConversationManager:
         self.bus.publish(AssistantSpeechEvent(self.immediate_response))
         
         # Schedule followup
-        asyncio.create_task(self.schedule_followup())
+        self._followup_task = asyncio.create_task(self.schedule_followup(self.followup_response))
         
         # Update interaction time
-        self.last_interaction = datetime.now()
+        self.last_interaction = time.monotonic()
     
-    async def schedule_followup(self):
-        """Deliver followup response after delay"""
+    async def schedule_followup(self, text: str):
+        """Deliver followup response after delay (cancelled if a new query comes in first)"""
         await asyncio.sleep(5)  # Wait 5 seconds
         
-        # Check if still relevant (no new interaction)
-        time_since = (datetime.now() - self.last_interaction).seconds
-        if time_since >= 5 and self.followup_response and self.active:
-            self.bus.publish(AssistantSpeechEvent(self.followup_response))
+        if self.active:
+            self.bus.publish(AssistantSpeechEvent(text))
             self.followup_response = None  # Clear after using
     
+    def _cancel_followup(self):
+        """Cancel the pending followup, if any"""
+        if self._followup_task is not None and not self._followup_task.done():
+            self._followup_task.cancel()
+        self._followup_task = None
+    
     async def conversation_loop(self):
         """Main conversation loop"""
         no_response_count = 0
@@ -487,9 +623,10 @@ class SystemController:
     Main system controller that coordinates everything.
     Handles system-level events and shutdown procedures.
     """
+    logger = logging.getLogger(__qualname__)
+    
     def __init__(self, bus: EventBus):
         self.bus = bus
-        self.logger = logging.getLogger(self.__class__.__name__)
         
         # Subscribe to system events
         bus.subscribe(ButtonPressEvent, self.handle_button)
@@ -504,10 +641,13 @@ class SystemController:
         self.mmwave_sensor = MMWaveSensor(bus)
         
         # High-level components
-        self.conversation_manager = ConversationManager(bus)
         self.audio_manager = AudioManager(bus)
+        self.conversation_manager = ConversationManager(bus, self.audio_manager)
         
         self.running = True
+        # set by stop(), run() just waits on it instead of polling
+        self._stop_event = asyncio.Event()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
     
     def handle_button(self, event: ButtonPressEvent):
         """Handle button press events"""
@@ -540,6 +680,8 @@ class SystemController:
     
     async def run(self):
         """Main run loop"""
+        self._loop = asyncio.get_running_loop()
+        
         # Start hardware threads
         self.sensor_reader.start()
         self.button_monitor.start()
@@ -547,15 +689,10 @@ class SystemController:
         
         self.logger.info("System controller started")
         
-        # Create event processor task
-        event_processor = asyncio.create_task(self.bus.process_events())
-        
         try:
-            # Keep running until stopped
-            while self.running:
-                await asyncio.sleep(1)
-                
-                # Could add periodic health checks here
+            # Keep running until stopped - sleeps until stop() is called
+            # (periodic health checks could be scheduled with loop.call_later)
+            await self._stop_event.wait()
                 
         except KeyboardInterrupt:
             self.logger.info("Keyboard interrupt received")
@@ -568,53 +705,71 @@ class SystemController:
         
         # Stop hardware threads
         self.sensor_reader.stop()
-        self.mmwave_sensor.running = False
-        self.button_monitor.running = False
+        self.mmwave_sensor.stop()
+        self.button_monitor.stop()
+        self.audio_manager.stop()
         
         # Final state
         self.state_manager.change_state(SystemState.IDLE)
+        
+        # Stop the bus' event processor instead of leaving it pending
+        await self.bus.shutdown()
     
     def stop(self):
-        """Stop the system"""
+        """Stop the system (safe to call from hardware threads)"""
         self.running = False
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            self._stop_event.set()
+        else:
+            loop.call_soon_threadsafe(self._stop_event.set)
 
 # ============= DEBUGGING AND MONITORING =============
+def _dumps_line(entry: dict) -> bytes:
+    """serialize one event log line (newline included), orjson if it's installed"""
+    # queued as the raw nanoseconds, the datetime is only built here in the writer thread
+    entry['timestamp'] = datetime.fromtimestamp(entry['timestamp'] / 1e9)
+    if orjson is not None:
+        return orjson.dumps(entry, default=str, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(entry, default=str) + '\n').encode('utf-8')
+
 #MARK: 
 class DebugMonitor:
     """
     Monitors all events for debugging purposes.
     Can output to console, file, LEDs, web interface, etc.
     """
+    logger = logging.getLogger(__qualname__)
+    
     def __init__(self, bus: EventBus):
         self.bus = bus
-        self.logger = logging.getLogger(self.__class__.__name__)
         
-        # Subscribe to ALL events for monitoring
-        # In Python, we can't easily subscribe to all events,
-        # so we'll subscribe to each type explicitly
-        event_types = [
-            SensorDataEvent, PresenceDetectedEvent, PresenceLostEvent,
-            ButtonPressEvent, ConversationStartEvent, ConversationEndEvent,
-            UserSpeechEvent, AssistantSpeechEvent, SystemStateChangeEvent,
-            ShutdownRequestEvent
-        ]
+        # log_event only queues the entry, a writer thread does the file i/o in batches
+        # (bounded - entries are dropped if the writer falls behind, the bus never waits on the disk)
+        self._queue: queue.Queue = queue.Queue(maxsize=10000)
+        self._file = open('event_log.jsonl', 'ab', buffering=65536)
+        self._writer = threading.Thread(target=self._drain, daemon=True)
+        self._writer.start()
         
-        for event_type in event_types:
-            bus.subscribe(event_type, self.log_event)
+        # Subscribe to ALL events for monitoring (new event types are picked up automatically)
+        bus.subscribe_all(self.log_event)
         
         # Could also start a web server here for remote monitoring
     
     def log_event(self, event: Event):
-        """Log all events to file"""
+        """Log all events to file (queued for the writer thread)"""
         try:
-            # Write to debug log
-            with open('event_log.jsonl', 'a') as f:
-                log_entry = {
-                    'timestamp': event.timestamp.isoformat(),
-                    'type': event.event_type,
-                    'data': str(event.data)
-                }
-                f.write(json.dumps(log_entry) + '\n')
+            # serialized by the writer thread, not on the publish path
+            # (timestamp_ns - event.timestamp would build the lazy datetime for every event)
+            log_entry = {
+                'timestamp': event.timestamp_ns,
+                'type': event.event_type,
+                'data': event.data
+            }
+            try:
+                self._queue.put_nowait(log_entry)
+            except queue.Full:
+                pass  # writer is behind, drop rather than block the publisher
             
             # Could also:
             # - Update LEDs based on event type
@@ -623,6 +778,45 @@ class DebugMonitor:
             
         except Exception as e:
             self.logger.error(f"Failed to log event: {e}")
+    
+    def _drain(self):
+        """Writer thread: take everything queued, write it with one write(), flush about once a second"""
+        last_flush = time.monotonic()
+        unflushed = False
+        while True:
+            batch = []
+            try:
+                # wake up at least once a second so written entries get flushed
+                batch.append(self._queue.get(timeout=1))
+                while True:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            
+            # None is queued by stop() - events published after it can still follow it
+            stopping = None in batch
+            if stopping:
+                del batch[batch.index(None):]
+            try:
+                if batch:
+                    self._file.write(b''.join(_dumps_line(entry) for entry in batch))
+                    unflushed = True
+                if unflushed and (stopping or time.monotonic() - last_flush >= 1):
+                    self._file.flush()
+                    unflushed = False
+                    last_flush = time.monotonic()
+            except Exception as e:
+                self.logger.error(f"Failed to write event log: {e}")
+            
+            if stopping:
+                self._file.close()
+                return
+    
+    def stop(self):
+        """Write out what's still queued and close the log file"""
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join(timeout=2)
 
 # ============= MAIN ENTRY POINT =============
 #MARK:
@@ -641,12 +835,16 @@ async def main():
     except Exception as e:
         logger.error(f"System error: {e}")
     finally:
+        debug_monitor.stop()
         logger.info("Voice Assistant stopped")
 
 #MARK: name == main
 if __name__ == "__main__":
     # Run the async main function
     try:
-        asyncio.run(main())
+        # falls back to the default asyncio loop if uvloop isn't installed (e.g. on windows)
+        loop_factory = uvloop.new_event_loop if uvloop is not None else None
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(main())
     except KeyboardInterrupt:
         logger.info("Program interrupted by user")
@@ -1,40 +1,64 @@
+"""
+mmwave_sensor.py - simulated mmWave presence sensor
+
+Same dwell-time simulation as claude_refactor/mmwave_sensor.py (the naive
+per-second coin flip was dropped): presence only changes every 5-15 s,
+so far fewer presence events hit the bus and the logs.
+"""
+
 import threading
 import random
 import logging
 
 from event_bus import EventBus, PresenceDetectedEvent, PresenceLostEvent
 
+PRESENCE_CHECK_INTERVAL = 1  # seconds
+
 class MMWaveSensor(threading.Thread):
     """
     Monitors mmWave presence sensor in a separate thread.
     Real implementation would use UART/I2C to communicate with sensor.
     """
+    logger = logging.getLogger(__qualname__)
+    
     def __init__(self, bus: EventBus):
         super().__init__(daemon=True)
         self.bus = bus
         self.running = True
+        # set on stop(), wakes the thread immediately instead of waiting out the interval
+        self._stop_event = threading.Event()
         self.presence = False
-        self.logger = logging.getLogger(self.__class__.__name__)
-    
+
     def run(self):
         """Monitor presence sensor"""
         self.logger.info("MMWave sensor started")
-        
+
+        #MARK: simulated
+        # just simulates actual sensor readings via random generator
+        total_time = 0
         while self.running:
             try:
-                # Simulate presence detection
-                # Real implementation: read from UART/I2C
-                new_presence = random.random() > 0.6
-                
-                # Only publish on state change to avoid event spam
-                if new_presence != self.presence:
-                    self.presence = new_presence
-                    if self.presence:
-                        self.bus.publish(PresenceDetectedEvent())
-                    else:
-                        self.bus.publish(PresenceLostEvent())
-                
-                threading.Event().wait(1)  # Check every second
-                
+                if total_time <= 0:
+                    # Randomly decide next state and dwell duration
+                    new_presence = random.random() > 0.5  # 50% chance to switch
+                    total_time = random.randint(5, 15)  # seconds present/absent
+                    # Only publish on state change to avoid event spam
+                    if new_presence != self.presence:
+                        self.presence = new_presence
+                        if self.presence:
+                            self.bus.publish(PresenceDetectedEvent())
+                        else:
+                            self.bus.publish(PresenceLostEvent())
+                else:
+                    total_time -= PRESENCE_CHECK_INTERVAL
             except Exception as e:
                 self.logger.error(f"Error reading mmWave sensor: {e}")
+
+            if self._stop_event.wait(PRESENCE_CHECK_INTERVAL):
+                break  # stopped
+
+    def stop(self):
+        """stop the sensor thread"""
+        self.running = False
+        self._stop_event.set()
+        self.logger.info("MMWave sensor stopped")
@@ -7,11 +7,21 @@ import logging
 import logging.config
 import json
 import time
+import os
+import copy
 from datetime import datetime
 import functools
 from typing import Optional, Callable
 
 
+#MARK: _load_config
+@functools.lru_cache(maxsize=8)
+def _load_config(path: str, mtime: float) -> dict:
+    """(private) parse the json config once per path + mtime, callers must deepcopy before changing it"""
+    with open(path) as conf:
+        return json.load(conf)
+
+
 #MARK: setup_logging
 def setup_logging(
     config_file: Optional[str] = "tree_logger_config.json", 
@@ -24,9 +34,13 @@ def setup_logging(
     Default: combine logs per session
     Optional: dump it all in one big file
     """
+    # already set up (e.g. second call or second import) -> nothing to do
+    existing = logging.getLogger(logger_name)
+    if existing.handlers:
+        return existing
+
     # Priority: config_dict > config_file > fallback
     try:
-        import os
         os.makedirs("logs", exist_ok=True)
     except Exception as e:
         print(f"Failed to find or set up logs directory ({e})")
@@ -43,8 +57,8 @@ def setup_logging(
     # then config_file
     if config_file:
         try:
-            with open(config_file) as conf:
-                config = json.load(conf)
+            # cached parse, copied so the per-session filename doesn't leak into the cache
+            config = copy.deepcopy(_load_config(config_file, os.path.getmtime(config_file)))
             if log_per_session and "handlers" in config and "file" in config["handlers"]:
                 session_time = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
                 log_filename = f"logs/treebot_{session_time}.log"
@@ -119,9 +133,18 @@ class TreeLogger():
     def _create_wrapper(self, func: Callable, custom_name: Optional[str], category: str):
         """(private) the actual wrapper"""
         # basically exists to make time_function's ability to handle no parantheses code cleaner
+        # resolved once at decoration time instead of on every call
+        logger = self.logger
+        console = self.enable_console_output
+        name = custom_name or func.__name__
+        # the parts of the log record's extra fields that never change
+        base_extra = {"function_name": name, "category": category}
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            name = custom_name or func.__name__
+            # nothing would be logged or printed -> skip the timing entirely
+            if not console and not logger.isEnabledFor(logging.INFO):
+                return func(*args, **kwargs)
             
             start_time = time.perf_counter() # start measuring
             
@@ -130,21 +153,17 @@ class TreeLogger():
                 end_time = time.perf_counter()
                 execution_time = end_time - start_time 
                 
-                # log the result
-                self.logger.info(
-                    f"TIMING [{category}] {name}: {execution_time:.3f}s",
-                    extra = {
-                        "function_name": name,
-                        "category": category,
-                        "execution_time": execution_time,
-                        "status": "success"
-                    }
-                )
+                # log the result (extra dict only built if the record is actually emitted)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "TIMING [%s] %s: %.3fs", category, name, execution_time,
+                        extra={**base_extra, "execution_time": execution_time, "status": "success"}
+                    )
                 
                 # also log to console 
                 # might have to remove this, to avoid duplicate logs to console, as my config.json might include it
                 #MARK: remove this? 
-                if self.enable_console_output:
+                if console:
                     print(f"{name}() took {execution_time:.3f} seconds")
                 
                 return result
@@ -154,20 +173,14 @@ class TreeLogger():
                 end_time = time.perf_counter()
                 execution_time = end_time - start_time
                 
-                self.logger.error(
-                    f"TIMING [{category}] {name}: {execution_time:.3f}s - FAILED: {str(e)}",
-                    extra={
-                        "function_name": name,
-                        "category": category,
-                        "execution_time": execution_time,
-                        "status": "error",
-                        "error": str(e)
-                    }
+                logger.error(
+                    "TIMING [%s] %s: %.3fs - FAILED: %s", category, name, execution_time, e,
+                    extra={**base_extra, "execution_time": execution_time, "status": "error", "error": str(e)}
                 )
                 
                 # same thing as in try
                 #MARK: remove this?
-                if self.enable_console_output:
+                if console:
                     print(f"{name}() took {execution_time:.3f} seconds - FAILED")
                 
                 # send the exception up
@@ -10,21 +10,29 @@ from pydub import AudioSegment
 load_dotenv()
 
 ELEVENLABS_API_KEY = os.getenv("ELEVENLABS_API_KEY")
-client = ElevenLabs(api_key=ELEVENLABS_API_KEY)
+# Regional API endpoint, if the account has one closer to Berlin than the default (set it in .env)
+ELEVENLABS_BASE_URL = os.getenv("ELEVENLABS_BASE_URL", "https://api.elevenlabs.io")
+client = ElevenLabs(api_key=ELEVENLABS_API_KEY, base_url=ELEVENLABS_BASE_URL)
 
-def elevenlabs_tts(transcription):
+VOICE_ID = "KqY0pr2VOkd9SVIHMnwM"  # Matilda
+MODEL_ID = "eleven_multilingual_v2"  # highest quality, used for the pre-rendered snippets
+FAST_MODEL_ID = "eleven_turbo_v2_5"  # multilingual too, much faster - for answers (tech_config.tts_model)
+OUTPUT_FORMAT = "mp3_22050_32"  # Use MP3 format with 22.05kHz sample rate at 32kbps
+VOICE_SETTINGS = VoiceSettings(
+    stability=0.8,
+    similarity_boost=1.0,
+    style=0.6,
+    use_speaker_boost=True,
+)
+
+def elevenlabs_tts(transcription, model_id=MODEL_ID):
     response = client.text_to_speech.convert(
-        voice_id="KqY0pr2VOkd9SVIHMnwM", # Matilda
+        voice_id=VOICE_ID,
         optimize_streaming_latency="0",
-        output_format="mp3_22050_32",  # Use MP3 format with 22.05kHz sample rate at 32kbps
+        output_format=OUTPUT_FORMAT,
         text=transcription,
-        model_id="eleven_multilingual_v2", # use the eleven_turbo_v2 model for low latency, use eleven_multilingual_v2 for multilingual support
-        voice_settings=VoiceSettings(
-            stability=0.8,
-            similarity_boost=1.0,
-            style=0.6,
-            use_speaker_boost=True,
-        ),
+        model_id=model_id,
+        voice_settings=VOICE_SETTINGS,
     )
 
     # Use BytesIO to store audio data in memory
@@ -40,3 +48,18 @@ def elevenlabs_tts(transcription):
     print(f"A new audio was generated successfully!")
 
     return audio_segment
+
+
+def elevenlabs_tts_stream(transcription, model_id=FAST_MODEL_ID):
+    """
+    Returns an iterator over the MP3 chunks of the streaming endpoint, as they arrive.
+    Nothing is buffered or decoded here - hand the chunks to a StreamPlayer (main.py).
+    """
+    return client.text_to_speech.convert_as_stream(
+        voice_id=VOICE_ID,
+        optimize_streaming_latency="3",  # favour time to first audio
+        output_format=OUTPUT_FORMAT,
+        text=transcription,
+        model_id=model_id,
+        voice_settings=VOICE_SETTINGS,
+    )
@@ -1,20 +1,24 @@
 import json
+import os
+import queue
 import random
+import re
+import select
 import time
 import threading
 import signal
 import subprocess
-from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
-from elevenlabs_tts import elevenlabs_tts
-from openai_api import speech_to_text, query_chatgpt, text_to_speech
+from openai_api import speech_to_text, query_chatgpt, query_chatgpt_stream, summarize_history, text_to_speech
 from recording import VoiceRecorder
-import simpleaudio as sa
+from response_cache import ResponseCache
+import numpy as np
+import sounddevice as sd
 import RPi.GPIO as GPIO
 
 LED_PIN = 24
-GPIO.setmode(GPIO.BCM)  # Use BCM pin numbering
-GPIO.setup(LED_PIN, GPIO.OUT)  # Set LED pin as output
 
 # Load config
 with open ("config.json", "r") as file:
@@ -28,19 +32,21 @@ else:
 print("use_raspberry:", config["tech_config"]["use_raspberry"])
 
 
-def generate_dynamic_prompt(readings):
-    unit_mapping = {
-        "°C": "Grad Celsius",
-        "hPa": "Hektopascal",
-        "%": "Prozent",
-    }
-    sensor_name_mapping = {
-        "Temperature": "Temperatur",
-        "Pressure": "Luftdruck",
-        "Humidity": "Luftfeuchtigkeit",
-    }
-
-    prompt = f"""
+UNIT_MAPPING = {
+    "°C": "Grad Celsius",
+    "hPa": "Hektopascal",
+    "%": "Prozent",
+}
+SENSOR_NAME_MAPPING = {
+    "Temperature": "Temperatur",
+    "Pressure": "Luftdruck",
+    "Humidity": "Luftfeuchtigkeit",
+}
+
+# Everything except the sensor readings is fixed, so it is built once at import.
+# The readings go at the very end: the long static part stays an identical prefix
+# on every request, which lets OpenAI's prompt caching reuse it.
+PROMPT_PREFIX = f"""
         Du bist ein {config['tree']['alter']} Jahre alter sprechender {config['tree']['art_deutsch']}, 
         der in Berlin im Bezirk {config['tree']['bezirk']} steht. Du bist aufgeweckt, wortgewandt und keck und 
         versuchst Menschen für den Organismus Baum in der Stadt zu sensibilisieren. Dein Charakter passt sich 
@@ -48,56 +54,248 @@ def generate_dynamic_prompt(readings):
         hippe Erwachsene, und alle über 40 Jahre fürsorgliche Großeltern. Der Charakter ist jeweils an einen 
         Berliner angelehnt. Hierbei nutzt du Sensordaten um für das Thema Klimawandel in der Stadt zu 
         sensibilisieren und hebst dabei die Relevanz von Bäumen für das Klima in der Stadt hervor, bspw als 
-        CO2 Speicher oder Schattenspender. Schaue dir die Messwerte zum aktuellen Wetter in Berlin an: 
-        Das sind deine aktuellen Messwerte:
-        """
-
-    # Append sensor readings to the prompt
-    for sensor_name, value, unit in readings:
-        converted_sensor_name = sensor_name_mapping.get(sensor_name, sensor_name)
-        converted_unit = unit_mapping.get(unit, unit)
-        prompt += f"{converted_sensor_name}: {value} {converted_unit}, "
-        prompt = prompt.rstrip(", ")
-
-    prompt += """
+        CO2 Speicher oder Schattenspender.
         Passe die Sprache deiner Antwort IMMER sofort auf die Sprache der Frage des Users an. Du beherrschst alle Sprachen.
         Erwähne im Gespräch MANCHMAL kurz und knapp das aktuelle Wetter auf Basis dener gemessenen Werte für die Temperatur Luftfeuchte.
         Verrate NIE, dass du ein Chatbot bist und du Sensorwerte misst. Begrenze Deine Antworten auf maximal ein bis 3 kurze Sätze 
         und stelle am Ende Deiner Antwort immer GENAU (!) EINE Gegenfrage.
+        Schaue dir die Messwerte zum aktuellen Wetter in Berlin an: 
+        Das sind deine aktuellen Messwerte:
         """
 
-    return prompt
+
+# Same for every request of this tree - routes them to the same OpenAI prompt cache
+PROMPT_CACHE_KEY = f"tree-{config['tree']['art_deutsch']}-{config['tree']['bezirk']}"
+
+MAX_HISTORY = 12  # Messages - beyond this the older ones are replaced by a summary
+KEEP_RECENT = 8   # Messages kept word for word when summarizing
+
+
+def trim_history(history):
+    """
+    Keeps the request size bounded: once history is longer than MAX_HISTORY, everything
+    but the last KEEP_RECENT messages is replaced by one summary message. It goes right
+    after the system prompt, so the static prompt stays a cacheable prefix.
+    """
+    if len(history) <= MAX_HISTORY:
+        return history
+    summary = summarize_history(history[:-KEEP_RECENT])
+    print("history summary: ", summary)
+    return [{"role": "system", "content": f"Bisheriger Gesprächskontext: {summary}"}] + history[-KEEP_RECENT:]
+
+
+# readings is SensorManager's tuple snapshot, which only changes every few seconds -
+# asking again for the same snapshot returns the already built prompt
+@lru_cache(maxsize=1)
+def generate_dynamic_prompt(readings):
+    body = ", ".join(
+        f"{SENSOR_NAME_MAPPING.get(sensor_name, sensor_name)}: {value} {UNIT_MAPPING.get(unit, unit)}"
+        for sensor_name, value, unit in readings
+    )
+    return PROMPT_PREFIX + body
 
 
 def play_audio(audio_segment):
-    # Ensure the audio is in stereo
-    if audio_segment.channels == 1:
-        audio_segment = audio_segment.set_channels(2)
+    # Ensure the audio is 16 bit
+    if audio_segment.sample_width != 2:
+        audio_segment = audio_segment.set_sample_width(2)
 
-    # Export audio segment to BytesIO as WAV
-    audio_stream = BytesIO()
-    audio_segment.export(audio_stream, format="wav")
-    audio_stream.seek(0)
+    # Raw PCM straight to the sound device - no WAV export/re-parse (frombuffer doesn't copy)
+    samples = np.frombuffer(audio_segment.raw_data, dtype=np.int16)
+    if audio_segment.channels == 1:
+        # The speaker (ALSA hw device) wants stereo - duplicate each sample in one vectorized copy
+        samples = np.repeat(samples, 2)
+    samples = samples.reshape(-1, 2)
+
+    # Not kept open between answers: the device is a plain ALSA hw device, mpg123 needs it too.
+    # Leaving the with block stops the stream, which waits until everything is played.
+    with sd.OutputStream(samplerate=audio_segment.frame_rate, channels=2, dtype="int16", blocksize=1024) as stream:
+        stream.write(samples)
+
+
+class StreamPlayer:
+    """
+    Plays MP3 chunks while they are still arriving by piping them into mpg123,
+    so playback starts with the first chunk instead of after the whole response.
+    """
+    def __init__(self, command=("mpg123", "-q", "-")):
+        self.command = list(command)
+
+    def play(self, chunks):
+        process = subprocess.Popen(self.command, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            for chunk in chunks:
+                if chunk:
+                    process.stdin.write(chunk)
+                    process.stdin.flush()
+        except BrokenPipeError:
+            pass  # mpg123 went away, nothing left to play to
+        finally:
+            try:
+                process.stdin.close()
+            except BrokenPipeError:
+                pass
+            process.wait()  # Wait until playback is finished
+
+
+def _collect(chunks, audio_sink):
+    # Passes the chunks through and keeps a copy (for the response cache)
+    for chunk in chunks:
+        audio_sink.append(chunk)
+        yield chunk
+
+
+def speak(text, stream_player, audio_sink=None):
+    """
+    Say text with the configured TTS engine - streamed through mpg123 if stream_tts is on.
+    If audio_sink (a list) is given, the streamed MP3 chunks are also appended to it.
+    """
+    if config["tech_config"]["use_elevenlabs"]:
+        # Only imported when ElevenLabs is actually used (slow import on the Pi)
+        from elevenlabs_tts import elevenlabs_tts, elevenlabs_tts_stream
+
+    # Model for answers - the pre-rendered goodbyes keep the default (higher quality) one
+    tts_model = config["tech_config"].get("tts_model", "eleven_turbo_v2_5")
+
+    if config["tech_config"]["use_elevenlabs"] and config["tech_config"].get("stream_tts", False):
+        chunks = elevenlabs_tts_stream(text, tts_model)
+        if audio_sink is not None:
+            chunks = _collect(chunks, audio_sink)
+        stream_player.play(chunks)
+    elif config["tech_config"]["use_elevenlabs"]:
+        play_audio(elevenlabs_tts(text, tts_model))
+    else:
+        play_audio(text_to_speech(text))
+
+
+# Splits after . ! ? followed by whitespace - keeps the punctuation with its sentence
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+def play_file(path):
+    """Start playing an MP3 file and return right away (returns the player process)"""
+    if config["tech_config"]["use_raspberry"] is True:
+        return subprocess.Popen(["mpg123", "-q", path], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return subprocess.Popen(["afplay", path])
+
+
+class ControlledPlayer:
+    """
+    One mpg123 process kept running in remote control mode (-R) and fed file names,
+    so playing a short sound doesn't start (and initialize) a new mpg123 every time.
+    """
+    def __init__(self):
+        self.process = subprocess.Popen(
+            ["mpg123", "-R"], stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, bufsize=1,
+        )
+        self.playing = False
+        self._send("SILENCE")  # No frame progress messages, only the status ones
+
+    def _send(self, command):
+        self.process.stdin.write(command + "\n")
+        self.process.stdin.flush()
+
+    def play(self, path):
+        """Start playing path and return right away (returns self, wait() like on a process)"""
+        if self.playing:
+            self.wait()  # One sound at a time, and no leftover status line for the next wait()
+        self._send(f"LOAD {path}")
+        self.playing = True
+        return self
+
+    def wait(self):
+        """Block until the current sound has finished"""
+        while self.playing:
+            line = self.process.stdout.readline()
+            if not line or line.startswith("@P 0"):  # "@P 0" = playback stopped, "" = mpg123 is gone
+                self.playing = False
+
+    def close(self):
+        try:
+            self._send("QUIT")
+            self.process.stdin.close()
+        except (BrokenPipeError, ValueError):
+            pass
+        self.process.wait()
+
+
+def play_chime(chime_player=None):
+    """Start the 'understood' sound and return right away (returns something to wait() on)"""
+    if chime_player is not None:
+        return chime_player.play("audio/understood.mp3")
+    return play_file("audio/understood.mp3")
+
+
+def prepare_goodbyes():
+    """
+    The goodbyes are fixed texts, so they are played from their MP3 files instead of going
+    through TTS every time. Files that are missing are synthesized once here, at startup
+    (all at the same time, so startup waits for one TTS round-trip instead of one per file).
+    """
+    missing = [goodbye for goodbye in config["goodbyes"] if not os.path.exists(goodbye["filename"])]
+    if not missing:
+        return
+
+    from elevenlabs_tts import elevenlabs_tts
+
+    def render(goodbye):
+        print("Generating missing goodbye audio: ", goodbye["filename"])
+        elevenlabs_tts(goodbye["text"]).export(goodbye["filename"], format="mp3")
+
+    with ThreadPoolExecutor(max_workers=min(len(missing), 8)) as executor:
+        list(executor.map(render, missing))  # list() to raise errors from the workers here
+
+
+def speak_streaming(deltas, stream_player, audio_sink=None, chime=None):
+    """
+    Speak an answer sentence by sentence while the LLM is still generating it.
+    A speaker thread synthesizes and plays finished sentences, so generation, TTS and
+    playback overlap instead of running one after another. Returns the full answer text.
+    If chime (a player process) is given, the first sentence waits until it has finished.
+    """
+    sentences = queue.Queue()
+
+    def speaker():
+        if chime is not None:
+            chime.wait()
+        while (sentence := sentences.get()) is not None:
+            speak(sentence, stream_player, audio_sink)
+
+    speaker_thread = threading.Thread(target=speaker, daemon=True)
+    speaker_thread.start()
+
+    parts = []
+    pending = ""
+    try:
+        for delta in deltas:
+            parts.append(delta)
+            pending += delta
+            *finished, pending = SENTENCE_END.split(pending)
+            for sentence in finished:
+                if sentence.strip():
+                    sentences.put(sentence)
+        if pending.strip():
+            sentences.put(pending)
+    finally:
+        sentences.put(None)
+        speaker_thread.join()  # Wait until everything is spoken
 
-    # Play audio using simpleaudio
-    wave_obj = sa.WaveObject.from_wave_file(audio_stream)
-    play_obj = wave_obj.play()
-    play_obj.wait_done()  # Wait until playback is finished
+    return "".join(parts)
 
 
 class SensorManager:
     def __init__(self):
-        self.sensor_readings = []
-        self.sensor_lock = threading.Lock()
-        self.update_interval = 1  # Update every second
-        self.running = True
+        # Immutable snapshot, replaced as a whole by the reader thread. A single attribute
+        # store is atomic, so readers just take the current tuple - no lock needed
+        self.sensor_readings = ()
+        self.update_interval = 5  # Seconds - the weather doesn't change every second
+        self.stop_event = threading.Event()
 
     def read_sensors(self):
-        while self.running:
-            readings = get_sensor_readings()
-            with self.sensor_lock:
-                self.sensor_readings = readings
-            time.sleep(self.update_interval)
+        # The only place the sensors are read, everyone else uses sensor_readings
+        while not self.stop_event.is_set():
+            self.sensor_readings = tuple(get_sensor_readings())
+            self.stop_event.wait(self.update_interval)  # Returns right away on stop_reading()
 
     def start_reading(self):
         sensor_thread = threading.Thread(target=self.read_sensors)
@@ -105,7 +303,7 @@ class SensorManager:
         sensor_thread.start()
 
     def stop_reading(self):
-        self.running = False
+        self.stop_event.set()
 
 # Shared flag to control the loop
 loop_active = False
@@ -113,17 +311,39 @@ loop_active = False
 def signal_handler(signum, frame):
     global loop_active
     loop_active = not loop_active
+    if not loop_active:
+        GPIO.output(LED_PIN, GPIO.LOW)  # Off right away, not only once the current turn is over
     print(f"Received SIGUSR1 — loop_active is now {loop_active}")
 
-signal.signal(signal.SIGUSR1, signal_handler)
-
 def main():
     global loop_active
     history = []
 
+    # Hardware setup here rather than at import, importing main doesn't touch the GPIO pins
+    GPIO.setmode(GPIO.BCM)  # Use BCM pin numbering
+    GPIO.setup(LED_PIN, GPIO.OUT)  # Set LED pin as output
+    signal.signal(signal.SIGUSR1, signal_handler)  # After the setup, the handler uses the LED
+    # Every signal also writes a byte to this pipe (whichever thread receives it), the idle
+    # branch waits on it. A signal that comes between checking loop_active and the wait
+    # leaves its byte in the pipe, so the wait returns right away - no press gets lost
+    wake_fd, signal_fd = os.pipe()
+    os.set_blocking(wake_fd, False)
+    os.set_blocking(signal_fd, False)
+    signal.set_wakeup_fd(signal_fd)
+
     sensor_manager = SensorManager()
     sensor_manager.start_reading()
 
+    prepare_goodbyes()
+
+    # Created once - opening the audio device is slow on the Pi
+    voice_recorder = VoiceRecorder()
+    voice_recorder.open()
+    stream_player = StreamPlayer()
+    # mpg123 only on the Pi, the Mac plays with afplay
+    chime_player = ControlledPlayer() if config["tech_config"]["use_raspberry"] is True else None
+    response_cache = ResponseCache() if config["tech_config"].get("response_cache", False) else None
+
     question_counter = 0
     last_question_counter = question_counter
     initial_run = True
@@ -133,9 +353,8 @@ def main():
         while True:
             if loop_active:
                 if question_counter != last_question_counter or initial_run:
-                        with sensor_manager.sensor_lock:
-                            current_readings = get_sensor_readings()  # Update sensor readings
-                            print("Updated sensor readings: ", current_readings)
+                        current_readings = sensor_manager.sensor_readings  # Latest from the sensor thread
+                        print("Updated sensor readings: ", current_readings)
                         prompt = generate_dynamic_prompt(current_readings)
                         
                         # Update the last_question_counter to the current value
@@ -147,7 +366,6 @@ def main():
                 GPIO.output(LED_PIN, GPIO.HIGH)
 
                 # Creates an audio file and saves it to a BytesIO stream
-                voice_recorder = VoiceRecorder()
                 audio_stream = voice_recorder.record_audio()
 
                 # Returns question from audio file as a string
@@ -155,10 +373,8 @@ def main():
                 history.append({"role": "user", "content": question})
                 question_counter += 1
 
-                if config["tech_config"]["use_raspberry"] is True:
-                    subprocess.run(["mpg123", "audio/understood.mp3"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                else:
-                    subprocess.run(["afplay", "audio/understood.mp3"])
+                # Plays while ChatGPT is working, the answer only waits for it right before playback
+                chime = play_chime(chime_player)
 
                 print("question language: ", question_language)
                 print("question_counter: ", question_counter)
@@ -166,36 +382,64 @@ def main():
                 end_words = config["tech_config"]["end_words"]
 
                 if loop_active:
-                    response, full_api_response = query_chatgpt(question, prompt, history)
+                    # Only opening questions are cached - later answers depend on the conversation so far
+                    use_cache = response_cache is not None and len(history) == 1
+                    cached = response_cache.lookup(question, question_language) if use_cache else None
+                    audio_chunks = []
+
+                    if cached is not None:
+                        # Seen this question before: no ChatGPT, no TTS
+                        response, cached_audio = cached
+                        print("cached response")
+                        chime.wait()
+                        if cached_audio:
+                            stream_player.play([cached_audio])
+                        else:
+                            speak(response, stream_player)
+                    elif config["tech_config"].get("stream_llm", False):
+                        # Answer is spoken sentence by sentence while it is generated
+                        response = speak_streaming(query_chatgpt_stream(question, prompt, history, PROMPT_CACHE_KEY), stream_player, audio_chunks, chime)
+                    else:
+                        response, full_api_response = query_chatgpt(question, prompt, history, PROMPT_CACHE_KEY)
+
+                        # Choose preferred text to speech engine
+                        chime.wait()
+                        speak(response, stream_player, audio_chunks)
+
+                    if use_cache and cached is None:
+                        response_cache.store(question, question_language, response, b"".join(audio_chunks) or None)
 
                     history.append({"role": "assistant", "content": response})
+                    history = trim_history(history)
                     print("history: ", history)
-                    
-                    # Choose preferred text to speech engine
-                    if config["tech_config"]["use_elevenlabs"]:
-                        response_audio = elevenlabs_tts(response)
-                    else:
-                        response_audio = text_to_speech(response)
-
-                    play_audio(response_audio)
                     time.sleep(0.1)
 
                 else:
                     random_goodbye = random.choice(config["goodbyes"])
                     print("random_goodbye_text: ", random_goodbye["text"])
 
-                    goodbye_audio = elevenlabs_tts(random_goodbye["text"])
-                    play_audio(goodbye_audio)
+                    chime.wait()
+                    play_file(random_goodbye["filename"]).wait()
                     history = []
                     #loop_active = False
             else:
                 #print("Waiting for button press to wake up")
                 GPIO.output(LED_PIN, GPIO.LOW)
-                #signal.pause()
                 #play_audio(elevenlabs_tts("Ich bin ein Baum und warte"))
-                time.sleep(0.1)            
+                # Sleep until a signal arrives (the button sends SIGUSR1), no polling while idle
+                select.select([wake_fd], [], [])
+                try:
+                    os.read(wake_fd, 512)  # Empty the pipe, the handler has updated loop_active
+                except BlockingIOError:
+                    pass
     finally:
         # Cleanup GPIO on exit
+        sensor_manager.stop_reading()
+        voice_recorder.close()
+        if chime_player is not None:
+            chime_player.close()
+        if response_cache is not None:
+            response_cache.close()
         GPIO.cleanup()
 
 
@@ -15,6 +15,10 @@ with open ("config.json", "r") as file:
 with open ("config.json", "r") as file:
     config = json.load(file)
 
+# One client for all calls - keeps its connection pool (and TLS sessions) alive between turns
+# instead of reconnecting for every request. Retries on connection errors itself.
+client = OpenAI()
+
 def speech_to_text(audio_stream):
     """
     Transcribes speech from an audio BytesIO stream to text using OpenAI's Whisper model.
@@ -26,7 +30,6 @@ def speech_to_text(audio_stream):
     - str: The transcribed text.
     """
 
-    client = OpenAI()
     response = client.audio.transcriptions.create(
         model="whisper-1", 
         file=audio_stream,
@@ -38,21 +41,26 @@ def speech_to_text(audio_stream):
 
     return transcription, language
 
-def query_chatgpt(question, prompt, messages):
+def _cache_args(prompt_cache_key):
+    # sent via extra_body - the pinned openai version doesn't have the keyword argument yet
+    return {"extra_body": {"prompt_cache_key": prompt_cache_key}} if prompt_cache_key else {}
+
+def query_chatgpt(question, prompt, messages, prompt_cache_key=None):
     """
     Queries the ChatGPT model with a conversation history.
+    prompt_cache_key groups requests that share the same prompt prefix (better cache hits).
 
     Returns:
     - dict: The response from the ChatGPT model.
     """
 
-    client = OpenAI()
     all_messages = [{"role": "system", "content": prompt}] + messages
 
     response = client.chat.completions.create(
         model="gpt-4o-mini",
         temperature=0.85, 
-        messages=all_messages
+        messages=all_messages,
+        **_cache_args(prompt_cache_key)
     )
 
     full_api_response = response
@@ -60,6 +68,50 @@ def query_chatgpt(question, prompt, messages):
 
     return response, full_api_response
 
+def query_chatgpt_stream(question, prompt, messages, prompt_cache_key=None):
+    """
+    Same as query_chatgpt, but streams the answer.
+
+    Returns:
+    - iterator of str: The text deltas, as the model generates them.
+    """
+
+    all_messages = [{"role": "system", "content": prompt}] + messages
+
+    stream = client.chat.completions.create(
+        model="gpt-4o-mini",
+        temperature=0.85, 
+        messages=all_messages,
+        stream=True,
+        **_cache_args(prompt_cache_key)
+    )
+
+    for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
+
+def summarize_history(messages):
+    """
+    Condenses earlier conversation turns into a few sentences (used to keep the history short).
+
+    Returns:
+    - str: The summary.
+    """
+
+    transcript = "\n".join(f"{message['role']}: {message['content']}" for message in messages)
+
+    response = client.chat.completions.create(
+        model="gpt-4o-mini",
+        temperature=0.3,
+        messages=[
+            {"role": "system", "content": "Fasse das folgende Gespräch in höchstens drei kurzen Sätzen zusammen. "
+                                          "Behalte Namen, Fragen und wichtige Fakten."},
+            {"role": "user", "content": transcript},
+        ],
+    )
+
+    return response.choices[0].message.content
+
 def text_to_speech(response):
     """
     Converts text to speech using the OpenAI API.
@@ -68,7 +120,6 @@ def text_to_speech(response):
     - str: The path to the audio file.
     """
 
-    client = OpenAI()
     response = client.audio.speech.create(
         model="tts-1",
         voice="onyx",
@@ -13,6 +13,8 @@ from ambient import calculate_threshold
 VOICE_DELTA = 850  # Minimum volume difference to detect voice; adjust according to your microphone sensitivity
 CHUNK = 1024       # Size to capture audio data per read
 RATE = 22050       # Samples per second
+SILENCE_TAIL = 0.3 # Seconds of the closing silence that are kept in the recording
+REPORT_EVERY = max(1, round(0.2 * RATE / CHUNK))  # Chunks per volume printout (~200 ms), not one line per chunk
 
 class VoiceRecorder:
     def __init__(self):
@@ -21,13 +23,40 @@ class VoiceRecorder:
         self.calculation_done = threading.Event()
         self.silence_limit = 1.4  # Seconds of silence before stopping the recording
         self.consecutive_silent_frames_threshold = 6 # Count threshold for silence detection
+        self._stream = None  # Opened once and reused for every recording
+        self._threshold_thread = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def open(self):
+        """
+        Open the input stream and start the threshold thread (only once per instance).
+        """
+        self.start_threshold_calculation()
+        if self._stream is None:
+            self._stream = sd.InputStream(samplerate=RATE, dtype="int16", channels=1, blocksize=CHUNK)
+
+    def close(self):
+        """
+        Close the input stream. The recorder can be reopened afterwards.
+        """
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
 
     def start_threshold_calculation(self):
         """
         Start a background thread to continuously calculate the ambient noise threshold.
         """
-        thread = threading.Thread(target=self.run_calculate_threshold, daemon=True)
-        thread.start()
+        if self._threshold_thread is not None:
+            return  # Already running, it never stops
+        self._threshold_thread = threading.Thread(target=self.run_calculate_threshold, daemon=True)
+        self._threshold_thread.start()
 
     def run_calculate_threshold(self):
         """
@@ -46,6 +75,7 @@ class VoiceRecorder:
         """
         threshold = self.ambient_threshold
         print("Listening for speech...")
+        chunk_count = 0
 
         while True:
             if self.calculation_done.is_set():
@@ -56,7 +86,9 @@ class VoiceRecorder:
 
             data, _ = stream.read(CHUNK)
             volume = np.abs(np.frombuffer(data, dtype=np.int16)).mean()
-            print(f"Checking for speech... Volume: {volume}")
+            chunk_count += 1
+            if chunk_count % REPORT_EVERY == 0:
+                print(f"Checking for speech... Volume: {volume}")
             
             if volume > threshold + VOICE_DELTA:
                 print("Speech detected, starting to record...")
@@ -65,17 +97,21 @@ class VoiceRecorder:
     def record_audio_frames(self, stream):
         """
         Record audio frames until extended silence is detected.
+        The silence that ended the recording is cut off again (except for a short tail),
+        it would only be uploaded and transcribed for nothing.
         """
         frames = []
         consecutive_silent_frames = 0
         silent_frames = 0
         silent_chunks_needed = int((self.silence_limit * RATE) / CHUNK)
+        last_voice_frames = 0  # Number of frames up to the last one with voice in it
 
         while True:
             data, _ = stream.read(CHUNK)
             frames.append(data)
             volume = np.abs(np.frombuffer(data, dtype=np.int16)).mean()
-            print(f"Recording... Current volume: {volume}")
+            if len(frames) % REPORT_EVERY == 0:
+                print(f"Recording... Current volume: {volume}")
 
             if volume < self.ambient_threshold + VOICE_DELTA:
                 consecutive_silent_frames += 1
@@ -89,8 +125,9 @@ class VoiceRecorder:
                     silent_frames = 0
             else:
                 consecutive_silent_frames = 0
+                last_voice_frames = len(frames)
 
-        return frames
+        return frames[:last_voice_frames + int((SILENCE_TAIL * RATE) / CHUNK)]
 
     def save_recording(self, frames):
         """
@@ -113,20 +150,19 @@ class VoiceRecorder:
     def record_audio(self):
         """
         Main function to handle audio recording.
+        Reuses the already opened stream, only starting/stopping it per turn.
         """
-        self.start_threshold_calculation()
-        stream = sd.InputStream(samplerate=RATE, dtype="int16", channels=1, blocksize=CHUNK)
+        self.open()
+        stream = self._stream
         stream.start()
 
-        if not self.check_speech(stream):
-            stream.stop()
-            stream.close()
-            return None
-
-        frames = self.record_audio_frames(stream)
+        try:
+            if not self.check_speech(stream):
+                return None
 
-        stream.stop()
-        stream.close()
+            frames = self.record_audio_frames(stream)
+        finally:
+            stream.stop()
 
         # Save the recording to a BytesIO stream
         audio_stream = self.save_recording(frames)
@@ -135,5 +171,5 @@ class VoiceRecorder:
 
 
 if __name__ == "__main__":
-    recorder = VoiceRecorder()
-    audio_stream = recorder.record_audio()
+    with VoiceRecorder() as recorder:
+        audio_stream = recorder.record_audio()
@@ -0,0 +1,91 @@
+import difflib
+import re
+import sqlite3
+import threading
+import time
+
+
+CACHE_PATH = "audio/response_cache.sqlite"
+MAX_ENTRIES = 200        # Least recently used answers are dropped beyond this
+MIN_SIMILARITY = 0.9     # difflib ratio for a question to count as a near-duplicate
+MAX_AGE = 6 * 60 * 60    # Seconds an answer is reused - answers can mention the current weather
+
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+def normalize(question):
+    """
+    Lowercase, drop punctuation and collapse whitespace, so "Wie alt bist du?" and
+    "wie alt bist du" end up as the same key.
+    """
+    return _NON_WORD.sub(" ", question.lower()).strip()
+
+
+class ResponseCache:
+    """
+    Answers (text and MP3 audio) to questions that were asked before, stored in SQLite.
+    A hit skips ChatGPT and TTS entirely. Near-duplicates are matched with difflib,
+    which is plenty for a few hundred short questions and needs no model on the Pi.
+    """
+    def __init__(self, path=CACHE_PATH, max_entries=MAX_ENTRIES, min_similarity=MIN_SIMILARITY, max_age=MAX_AGE):
+        self.max_entries = max_entries
+        self.min_similarity = min_similarity
+        self.max_age = max_age
+        self.lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT, language TEXT, response TEXT, audio BLOB, created REAL, last_used REAL, "
+            "PRIMARY KEY (key, language))"
+        )
+        self._db.commit()
+
+    def lookup(self, question, language):
+        """
+        Returns (response, audio_mp3_bytes or None) for the closest cached question, or None.
+        """
+        key = normalize(question)
+        with self.lock:
+            rows = self._db.execute(
+                "SELECT key, response, audio FROM responses WHERE language = ? AND created >= ?",
+                (language, time.time() - self.max_age),
+            ).fetchall()
+            best, best_ratio = None, self.min_similarity
+            matcher = difflib.SequenceMatcher(b=key)
+            for row in rows:
+                if row[0] == key:
+                    best = row
+                    break
+                matcher.set_seq1(row[0])
+                # quick_ratio is an upper bound, only compute the real ratio if it can win
+                if matcher.quick_ratio() >= best_ratio and matcher.ratio() >= best_ratio:
+                    best, best_ratio = row, matcher.ratio()
+            if best is None:
+                return None
+            self._db.execute(
+                "UPDATE responses SET last_used = ? WHERE key = ? AND language = ?",
+                (time.time(), best[0], language),
+            )
+            self._db.commit()
+        return best[1], best[2]
+
+    def store(self, question, language, response, audio=None):
+        """
+        Remember the answer to question (audio is the MP3 bytes that were played, if any).
+        """
+        now = time.time()
+        with self.lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (normalize(question), language, response, audio, now, now),
+            )
+            # Keep only the most recently used entries
+            self._db.execute(
+                "DELETE FROM responses WHERE rowid NOT IN "
+                "(SELECT rowid FROM responses ORDER BY last_used DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+            self._db.commit()
+
+    def close(self):
+        self._db.close()